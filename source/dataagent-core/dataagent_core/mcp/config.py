@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPServerConfig:
     """Configuration for a single MCP server.
 
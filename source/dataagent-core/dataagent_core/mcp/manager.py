@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -36,15 +37,20 @@ class MCPConnectionManager:
         self,
         max_connections_per_user: int = 10,
         max_total_connections: int = 100,
+        client_factory: Callable[[dict[str, Any]], Any] | None = None,
     ) -> None:
         """Initialize the connection manager.
         
         Args:
             max_connections_per_user: Maximum MCP connections per user.
             max_total_connections: Maximum total MCP connections.
+            client_factory: Callable building an MCP client from a
+                MultiServerMCPClient-style config dict. The client must expose
+                an async ``get_tools()``. Defaults to MultiServerMCPClient.
         """
         self.max_connections_per_user = max_connections_per_user
         self.max_total_connections = max_total_connections
+        self._client_factory = client_factory
         
         # user_id -> {server_name -> MCPConnection}
         self._connections: dict[str, dict[str, MCPConnection]] = {}
@@ -108,12 +114,15 @@ class MCPConnectionManager:
         """
         connection = MCPConnection(server_config=server_config)
         
-        try:
-            from langchain_mcp_adapters.client import MultiServerMCPClient
-        except ImportError as e:
-            connection.error = f"langchain-mcp-adapters not installed: {e}"
-            print(f"[MCP Manager] Import error: {connection.error}")
-            return connection
+        client_class = self._client_factory
+        if client_class is None:
+            try:
+                from langchain_mcp_adapters.client import MultiServerMCPClient
+            except ImportError as e:
+                connection.error = f"langchain-mcp-adapters not installed: {e}"
+                print(f"[MCP Manager] Import error: {connection.error}")
+                return connection
+            client_class = MultiServerMCPClient
         
         # For URL-based servers, try auto-detecting transport type
         if server_config.url:
@@ -122,7 +131,7 @@ class MCPConnectionManager:
             for transport in transports_to_try:
                 print(f"[MCP Manager] Trying '{server_config.name}' with transport: {transport}")
                 result = await self._try_connect(
-                    server_config, transport, MultiServerMCPClient
+                    server_config, transport, client_class
                 )
                 if result.connected:
                     # Update server_config with successful transport
@@ -139,7 +148,7 @@ class MCPConnectionManager:
         else:
             # Command-based server, no transport detection needed
             return await self._try_connect(
-                server_config, None, MultiServerMCPClient
+                server_config, None, client_class
             )
     
     def _get_transports_to_try(self, server_config: MCPServerConfig) -> list[str]:
@@ -161,7 +170,7 @@ class MCPConnectionManager:
         self,
         server_config: MCPServerConfig,
         transport: str | None,
-        client_class: type,
+        client_class: Callable[[dict[str, Any]], Any],
     ) -> MCPConnection:
         """Try to connect with a specific transport type."""
         connection = MCPConnection(server_config=server_config)
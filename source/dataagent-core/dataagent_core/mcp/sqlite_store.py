@@ -5,19 +5,111 @@ from __future__ import annotations
 import json
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 
 from dataagent_core.mcp.config import MCPConfig, MCPServerConfig
 from dataagent_core.mcp.store import MCPConfigStore
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncEngine
 
 logger = logging.getLogger(__name__)
 
+# Applied to every connection of an engine owned by the store.
+# journal_mode persists in the database file; the rest are per-connection.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a JSON column value, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+def _loads(data: str | bytes) -> Any:
+    """Deserialize a JSON column value, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Statements are built once so SQLAlchemy's compiled cache and sqlite3's
+# per-connection statement cache are hit on every call.
+_SELECT_COLUMNS = (
+    "SELECT server_name, command, args, env, url, transport, headers, disabled, auto_approve"
+    " FROM mcp_servers"
+)
+_SELECT_USER_SERVERS = text(f"{_SELECT_COLUMNS} WHERE user_id = :user_id")
+_SELECT_SERVER = text(
+    f"{_SELECT_COLUMNS} WHERE user_id = :user_id AND server_name = :server_name"
+)
+_DELETE_USER_SERVERS = text("DELETE FROM mcp_servers WHERE user_id = :user_id")
+_DELETE_SERVER = text(
+    "DELETE FROM mcp_servers WHERE user_id = :user_id AND server_name = :server_name"
+)
+# SQLite uses INSERT OR REPLACE for upsert
+_UPSERT_SERVER = text("""
+    INSERT OR REPLACE INTO mcp_servers 
+    (user_id, server_name, command, args, env, url, transport, headers, disabled, auto_approve)
+    VALUES (:user_id, :server_name, :command, :args, :env, :url, :transport, :headers, :disabled, :auto_approve)
+""")
+
+
+def _server_params(user_id: str, server: MCPServerConfig) -> dict[str, Any]:
+    """Build the bind parameters for upserting a server row."""
+    return {
+        "user_id": user_id,
+        "server_name": server.name,
+        "command": server.command,
+        "args": _dumps(server.args),
+        "env": _dumps(server.env),
+        "url": server.url,
+        "transport": server.transport or "sse",
+        "headers": _dumps(server.headers) if server.headers else None,
+        "disabled": 1 if server.disabled else 0,
+        "auto_approve": _dumps(server.auto_approve),
+    }
+
+
+def _row_to_server(row: Any) -> MCPServerConfig:
+    """Build a server configuration from a `_SELECT_COLUMNS` row."""
+    return MCPServerConfig(
+        name=row[0],
+        command=row[1] or "",
+        args=_loads(row[2]) if row[2] else [],
+        env=_loads(row[3]) if row[3] else {},
+        url=row[4],
+        transport=row[5] or "sse",
+        headers=_loads(row[6]) if row[6] else {},
+        disabled=bool(row[7]),
+        auto_approve=_loads(row[8]) if row[8] else [],
+    )
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Tune a new SQLite connection for many small write transactions."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 class SQLiteMCPConfigStore(MCPConfigStore):
     """SQLite-based MCP configuration storage.
@@ -25,10 +117,13 @@ class SQLiteMCPConfigStore(MCPConfigStore):
     Ideal for development and single-instance deployments.
     
     Args:
-        db_path: Path to SQLite database file.
+        db_path: Path to SQLite database file, or ``IN_MEMORY`` for a private
+            in-memory database that lives as long as the store.
         engine: Optional existing SQLAlchemy async engine to share.
     """
     
+    IN_MEMORY = ":memory:"
+    
     def __init__(
         self,
         db_path: str | Path | None = None,
@@ -38,13 +133,17 @@ class SQLiteMCPConfigStore(MCPConfigStore):
             self._engine = engine
             self._owns_engine = False
         else:
-            if db_path is None:
-                db_path = Path.home() / ".dataagent" / "dataagent.db"
-            db_path = Path(db_path)
-            db_path.parent.mkdir(parents=True, exist_ok=True)
+            if db_path == self.IN_MEMORY:
+                url = "sqlite+aiosqlite://"
+            else:
+                if db_path is None:
+                    db_path = Path.home() / ".dataagent" / "dataagent.db"
+                db_path = Path(db_path)
+                db_path.parent.mkdir(parents=True, exist_ok=True)
+                url = f"sqlite+aiosqlite:///{db_path}"
             
-            url = f"sqlite+aiosqlite:///{db_path}"
             self._engine = create_async_engine(url, echo=False)
+            event.listen(self._engine.sync_engine, "connect", _apply_sqlite_pragmas)
             self._owns_engine = True
         
         self._session_factory = sessionmaker(
@@ -59,8 +158,6 @@ class SQLiteMCPConfigStore(MCPConfigStore):
         if self._table_created:
             return
 
-        from sqlalchemy import text
-
         create_table_sql = """
         CREATE TABLE IF NOT EXISTS mcp_servers (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -102,31 +199,13 @@ class SQLiteMCPConfigStore(MCPConfigStore):
     async def get_user_config(self, user_id: str) -> MCPConfig:
         await self.init_tables()
 
-        from sqlalchemy import text
-
-        query = text("""
-            SELECT server_name, command, args, env, url, transport, headers, disabled, auto_approve
-            FROM mcp_servers
-            WHERE user_id = :user_id
-        """)
-
         async with self._engine.connect() as conn:
-            result = await conn.execute(query, {"user_id": user_id})
+            result = await conn.execute(_SELECT_USER_SERVERS, {"user_id": user_id})
             rows = result.fetchall()
 
         servers = {}
         for row in rows:
-            server = MCPServerConfig(
-                name=row[0],
-                command=row[1] or "",
-                args=json.loads(row[2]) if row[2] else [],
-                env=json.loads(row[3]) if row[3] else {},
-                url=row[4],
-                transport=row[5] or "sse",
-                headers=json.loads(row[6]) if row[6] else {},
-                disabled=bool(row[7]),
-                auto_approve=json.loads(row[8]) if row[8] else [],
-            )
+            server = _row_to_server(row)
             servers[server.name] = server
 
         return MCPConfig(servers=servers)
@@ -134,64 +213,52 @@ class SQLiteMCPConfigStore(MCPConfigStore):
     async def save_user_config(self, user_id: str, config: MCPConfig) -> None:
         await self.init_tables()
         
-        # Delete existing and insert new
-        await self.delete_user_config(user_id)
-        
-        for server in config.servers.values():
-            await self.add_server(user_id, server)
+        # Delete existing and insert new in a single transaction
+        async with self._engine.begin() as conn:
+            await conn.execute(_DELETE_USER_SERVERS, {"user_id": user_id})
+            if config.servers:
+                await conn.execute(
+                    _UPSERT_SERVER,
+                    [_server_params(user_id, s) for s in config.servers.values()],
+                )
     
     async def delete_user_config(self, user_id: str) -> bool:
         await self.init_tables()
         
-        from sqlalchemy import text
-        
-        query = text("DELETE FROM mcp_servers WHERE user_id = :user_id")
-        
         async with self._engine.begin() as conn:
-            result = await conn.execute(query, {"user_id": user_id})
+            result = await conn.execute(_DELETE_USER_SERVERS, {"user_id": user_id})
             return result.rowcount > 0
     
     async def add_server(self, user_id: str, server: MCPServerConfig) -> None:
+        await self.bulk_add_servers(user_id, [server])
+    
+    async def bulk_add_servers(
+        self,
+        user_id: str,
+        servers: list[MCPServerConfig],
+    ) -> None:
+        """Add or update several servers in one transaction.
+        
+        Args:
+            user_id: The user identifier.
+            servers: The server configurations to add.
+        """
+        if not servers:
+            return
+        
         await self.init_tables()
 
-        from sqlalchemy import text
-
-        # SQLite uses INSERT OR REPLACE for upsert
-        query = text("""
-            INSERT OR REPLACE INTO mcp_servers 
-            (user_id, server_name, command, args, env, url, transport, headers, disabled, auto_approve)
-            VALUES (:user_id, :server_name, :command, :args, :env, :url, :transport, :headers, :disabled, :auto_approve)
-        """)
-
         async with self._engine.begin() as conn:
             await conn.execute(
-                query,
-                {
-                    "user_id": user_id,
-                    "server_name": server.name,
-                    "command": server.command,
-                    "args": json.dumps(server.args),
-                    "env": json.dumps(server.env),
-                    "url": server.url,
-                    "transport": server.transport or "sse",
-                    "headers": json.dumps(server.headers) if server.headers else None,
-                    "disabled": 1 if server.disabled else 0,
-                    "auto_approve": json.dumps(server.auto_approve),
-                },
+                _UPSERT_SERVER,
+                [_server_params(user_id, server) for server in servers],
             )
     
     async def remove_server(self, user_id: str, server_name: str) -> bool:
         await self.init_tables()
         
-        from sqlalchemy import text
-        
-        query = text("""
-            DELETE FROM mcp_servers
-            WHERE user_id = :user_id AND server_name = :server_name
-        """)
-        
         async with self._engine.begin() as conn:
-            result = await conn.execute(query, {
+            result = await conn.execute(_DELETE_SERVER, {
                 "user_id": user_id,
                 "server_name": server_name,
             })
@@ -200,17 +267,9 @@ class SQLiteMCPConfigStore(MCPConfigStore):
     async def get_server(self, user_id: str, server_name: str) -> MCPServerConfig | None:
         await self.init_tables()
 
-        from sqlalchemy import text
-
-        query = text("""
-            SELECT server_name, command, args, env, url, transport, headers, disabled, auto_approve
-            FROM mcp_servers
-            WHERE user_id = :user_id AND server_name = :server_name
-        """)
-
         async with self._engine.connect() as conn:
             result = await conn.execute(
-                query,
+                _SELECT_SERVER,
                 {
                     "user_id": user_id,
                     "server_name": server_name,
@@ -221,14 +280,4 @@ class SQLiteMCPConfigStore(MCPConfigStore):
         if not row:
             return None
 
-        return MCPServerConfig(
-            name=row[0],
-            command=row[1] or "",
-            args=json.loads(row[2]) if row[2] else [],
-            env=json.loads(row[3]) if row[3] else {},
-            url=row[4],
-            transport=row[5] or "sse",
-            headers=json.loads(row[6]) if row[6] else {},
-            disabled=bool(row[7]),
-            auto_approve=json.loads(row[8]) if row[8] else [],
-        )
+        return _row_to_server(row)
@@ -104,7 +104,8 @@ class MemoryMCPConfigStore(MCPConfigStore):
         self._configs: dict[str, MCPConfig] = {}
     
     async def get_user_config(self, user_id: str) -> MCPConfig:
-        return self._configs.get(user_id, MCPConfig())
+        config = self._configs.get(user_id)
+        return config if config is not None else MCPConfig()
     
     async def save_user_config(self, user_id: str, config: MCPConfig) -> None:
         self._configs[user_id] = config
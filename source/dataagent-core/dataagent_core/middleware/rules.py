@@ -22,7 +22,12 @@ from langchain.agents.middleware.types import (
 )
 from langgraph.runtime import Runtime
 
-from dataagent_core.rules.models import Rule, RuleEvaluationTrace, RuleMatch
+from dataagent_core.rules.models import (
+    Rule,
+    RuleEvaluationTrace,
+    RuleInclusion,
+    RuleMatch,
+)
 from dataagent_core.rules.store import RuleStore
 from dataagent_core.rules.matcher import RuleMatcher, MatchContext
 from dataagent_core.rules.merger import RuleMerger
@@ -46,6 +51,14 @@ class RulesStateUpdate(TypedDict):
 # Pattern for manual rule references: @rulename
 RULES_MANUAL_REFERENCE_PATTERN = re.compile(r"@(\w[\w\-]*)")
 
+# Pattern for file references: `path/to/file.py`, file:..., path:...
+# One alternation so message content is scanned in a single pass.
+RULES_FILE_REFERENCE_PATTERN = re.compile(
+    r"`(?P<backtick>[^`]+\.\w+)`"
+    r"|file:(?P<file>[^\s]+)"
+    r"|path:(?P<path>[^\s]+)"
+)
+
 
 class RulesMiddleware(AgentMiddleware):
     """Middleware for loading and applying agent rules.
@@ -67,6 +80,7 @@ class RulesMiddleware(AgentMiddleware):
         debug_mode: bool = False,
         max_content_size: int = 100_000,
         event_callback: Callable[[RulesAppliedEvent | RuleDebugEvent], None] | None = None,
+        trace_enabled: bool = True,
     ) -> None:
         """Initialize rules middleware.
         
@@ -75,11 +89,14 @@ class RulesMiddleware(AgentMiddleware):
             debug_mode: If True, include debug info in system prompt.
             max_content_size: Maximum total size of rule content.
             event_callback: Optional callback to receive rule events.
+            trace_enabled: If False, skip building evaluation traces unless
+                debug mode or an event callback needs them.
         """
         self.store = store
         self.matcher = RuleMatcher()
         self.merger = RuleMerger(max_content_size=max_content_size)
         self.debug_mode = debug_mode
+        self.trace_enabled = trace_enabled
         self._last_trace: RuleEvaluationTrace | None = None
         self._event_callback = event_callback
 
@@ -117,40 +134,50 @@ class RulesMiddleware(AgentMiddleware):
 
     def _inject_rules(self, request: ModelRequest) -> ModelRequest:
         """Inject rules into the request's system prompt."""
-        # Build match context from request
-        context = self._build_match_context(request)
-        
         # Get all rules from store
         all_rules = self.store.list_rules()
         
+        # Build match context from request; with no rules there is nothing
+        # to match, so skip scanning the conversation
+        context = self._build_match_context(request) if all_rules else MatchContext()
+        
         # Match rules against context
         matched, skipped = self.matcher.match_rules(all_rules, context)
         
         # Merge matched rules
         final_rules, conflicts = self.merger.merge_rules(matched)
         
-        # Record trace
-        request_id = str(uuid.uuid4())[:8]
-        trace = RuleEvaluationTrace(
-            request_id=request_id,
-            timestamp=datetime.now(),
-            evaluated_rules=[r.name for r in all_rules],
-            matched_rules=matched,
-            skipped_rules=skipped,
-            conflicts=conflicts,
-            final_rules=[r.name for r in final_rules],
-            total_content_size=sum(len(r.content) for r in final_rules),
-        )
+        # Record trace, only when something will read it
+        trace: RuleEvaluationTrace | None = None
+        if self.trace_enabled or self.debug_mode or self._event_callback:
+            request_id = str(uuid.uuid4())[:8]
+            trace = RuleEvaluationTrace(
+                request_id=request_id,
+                timestamp=datetime.now(),
+                evaluated_rules=[r.name for r in all_rules],
+                matched_rules=matched,
+                skipped_rules=skipped,
+                conflicts=conflicts,
+                final_rules=[r.name for r in final_rules],
+                total_content_size=sum(len(r.content) for r in final_rules),
+            )
+            
+            # Emit events
+            self._emit_events(trace, matched, conflicts)
         self._last_trace = trace
         
-        # Emit events
-        self._emit_events(trace, matched, conflicts)
-        
-        # Build rules section for system prompt
-        rules_section = self.merger.build_prompt_section(final_rules)
+        # Build rules section for system prompt. Always-included rules go
+        # first so the prompt keeps a stable prefix across requests (and
+        # upstream prompt caches hit); conditional rules follow. The sort is
+        # stable, so merger order is kept within each group.
+        prompt_rules = sorted(
+            final_rules,
+            key=lambda r: r.inclusion is not RuleInclusion.ALWAYS,
+        )
+        rules_section = self.merger.build_prompt_section(prompt_rules)
         
         # Add debug info if enabled
-        if self.debug_mode:
+        if self.debug_mode and trace is not None:
             rules_section += self._build_debug_section(trace)
         
         # Combine with existing system prompt
@@ -193,21 +220,11 @@ class RulesMiddleware(AgentMiddleware):
 
     def _extract_file_references(self, content: str) -> list[str]:
         """Extract file references from message content."""
-        files: list[str] = []
-        
-        # Match files in backticks: `path/to/file.py`
-        backtick_pattern = r"`([^`]+\.\w+)`"
-        files.extend(re.findall(backtick_pattern, content))
-        
-        # Match file: prefix
-        file_prefix_pattern = r"file:([^\s]+)"
-        files.extend(re.findall(file_prefix_pattern, content))
-        
-        # Match path: prefix
-        path_prefix_pattern = r"path:([^\s]+)"
-        files.extend(re.findall(path_prefix_pattern, content))
-        
-        return files
+        # Exactly one named group participates in each match
+        return [
+            match.group(match.lastgroup)
+            for match in RULES_FILE_REFERENCE_PATTERN.finditer(content)
+        ]
 
     def _build_debug_section(self, trace: RuleEvaluationTrace) -> str:
         """Build debug information section."""
@@ -255,6 +272,10 @@ class RulesMiddleware(AgentMiddleware):
         """Enable or disable debug mode."""
         self.debug_mode = enabled
 
+    def set_trace_enabled(self, enabled: bool) -> None:
+        """Enable or disable trace recording."""
+        self.trace_enabled = enabled
+
     def get_triggered_rules(self) -> list[str]:
         """Get list of triggered rule names from last evaluation."""
         if self._last_trace:
@@ -4,6 +4,7 @@
 **Validates: Requirements 14.1, 14.2, 14.3, 14.4, 14.5**
 """
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -80,6 +81,10 @@ class ConflictDetector:
         """
         report = ConflictReport()
         
+        # Conflicts need at least two rules
+        if len(rules) < 2:
+            return report
+        
         # Detect same-name conflicts
         self._detect_same_name_conflicts(rules, report)
         
@@ -92,20 +97,18 @@ class ConflictDetector:
         self, rules: list[Rule], report: ConflictReport
     ) -> None:
         """Detect rules with the same name at different scopes."""
-        # Group rules by name
-        rules_by_name: dict[str, list[Rule]] = {}
+        # Group rules by name in a single pass
+        rules_by_name: defaultdict[str, list[Rule]] = defaultdict(list)
         for rule in rules:
-            if rule.name not in rules_by_name:
-                rules_by_name[rule.name] = []
             rules_by_name[rule.name].append(rule)
         
         # Check for conflicts
         for name, rule_list in rules_by_name.items():
             if len(rule_list) > 1:
-                # Sort by scope priority
+                # Sort by scope priority, then rule priority
                 sorted_rules = sorted(
                     rule_list,
-                    key=lambda r: self.SCOPE_PRIORITY.get(r.scope, 0),
+                    key=self._resolution_key,
                     reverse=True,
                 )
                 
@@ -113,14 +116,24 @@ class ConflictDetector:
                 winner = sorted_rules[0]
                 
                 for loser in sorted_rules[1:]:
+                    if winner.scope == loser.scope:
+                        # Same scope: rule priority decides the winner
+                        resolution = (
+                            f"priority {winner.priority} takes precedence "
+                            f"over priority {loser.priority}"
+                        )
+                        details = f"Rule '{name}' is defined more than once at {winner.scope.value} scope"
+                    else:
+                        resolution = f"{winner.scope.value} scope takes precedence"
+                        details = f"Rule '{name}' exists at both {winner.scope.value} and {loser.scope.value} scopes"
                     conflict = RuleConflict(
                         rule1_name=winner.name,
                         rule1_scope=winner.scope,
                         rule2_name=loser.name,
                         rule2_scope=loser.scope,
                         conflict_type="same_name",
-                        resolution=f"{winner.scope.value} scope takes precedence",
-                        details=f"Rule '{name}' exists at both {winner.scope.value} and {loser.scope.value} scopes",
+                        resolution=resolution,
+                        details=details,
                     )
                     report.conflicts.append(conflict)
 
@@ -175,10 +188,8 @@ class ConflictDetector:
         if not rules:
             return None
         
-        return max(
-            rules,
-            key=lambda r: (
-                self.SCOPE_PRIORITY.get(r.scope, 0),
-                r.priority,
-            ),
-        )
+        return max(rules, key=self._resolution_key)
+
+    def _resolution_key(self, rule: Rule) -> tuple[int, int]:
+        """Sort key used to pick the winner among same-name rules."""
+        return (self.SCOPE_PRIORITY.get(rule.scope, 0), rule.priority)
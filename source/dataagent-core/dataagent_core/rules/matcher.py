@@ -6,7 +6,9 @@ This module handles matching rules against the current context:
 """
 
 import fnmatch
+import functools
 import logging
+import re
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -15,6 +17,18 @@ from dataagent_core.rules.models import Rule, RuleInclusion, RuleMatch
 
 logger = logging.getLogger(__name__)
 
+# Reference extraction patterns
+_MANUAL_REF_RE = re.compile(r"@(\w[\w\-]*)")
+_BACKTICK_FILE_RE = re.compile(r"`([^`]+\.\w+)`")
+_FILE_PREFIX_RE = re.compile(r"file:([^\s]+)")
+_PATH_PREFIX_RE = re.compile(r"path:([^\s]+)")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compile a glob pattern to a regex, caching the result."""
+    return re.compile(fnmatch.translate(pattern))
+
 
 @dataclass
 class MatchContext:
@@ -69,6 +83,8 @@ class RuleMatcher:
         """
         matched: list[RuleMatch] = []
         skipped: list[tuple[str, str]] = []
+        # Set lookup for manual references, built once per call
+        manual_rules = frozenset(context.manual_rules)
 
         for rule in rules:
             # Skip disabled rules
@@ -77,7 +93,7 @@ class RuleMatcher:
                 continue
 
             # Try to match the rule
-            match_result = self._match_rule(rule, context)
+            match_result = self._match_rule(rule, context, manual_rules)
             
             if match_result:
                 matched.append(match_result)
@@ -89,12 +105,18 @@ class RuleMatcher:
 
         return matched, skipped
 
-    def _match_rule(self, rule: Rule, context: MatchContext) -> RuleMatch | None:
+    def _match_rule(
+        self,
+        rule: Rule,
+        context: MatchContext,
+        manual_rules: frozenset[str],
+    ) -> RuleMatch | None:
         """Match a single rule against context.
         
         Args:
             rule: The rule to match.
             context: The matching context.
+            manual_rules: Names from context.manual_rules, as a set.
             
         Returns:
             RuleMatch if the rule matches, None otherwise.
@@ -106,7 +128,7 @@ class RuleMatcher:
             )
 
         if rule.inclusion == RuleInclusion.MANUAL:
-            if rule.name in context.manual_rules:
+            if rule.name in manual_rules:
                 return RuleMatch(
                     rule=rule,
                     match_reason="manually referenced",
@@ -147,34 +169,40 @@ class RuleMatcher:
         Returns:
             List of file paths that match the pattern.
         """
+        glob = _compile_glob(pattern)
+        recursive: tuple[str, re.Pattern[str]] | None = None
+        if "**" in pattern:
+            # Convert ** pattern to work with fnmatch
+            # e.g., "src/**/*.py" should match "src/foo/bar.py"
+            parts = pattern.split("**")
+            if len(parts) == 2:
+                prefix, suffix = parts
+                recursive = (
+                    prefix.rstrip("/"),
+                    _compile_glob(f"*{suffix.lstrip('/')}"),
+                )
+
         matched = []
         
         for file_path in files:
             # Try matching the full path
-            if fnmatch.fnmatch(file_path, pattern):
+            if glob.match(file_path):
                 matched.append(file_path)
                 continue
             
             # Try matching just the filename
             filename = file_path.split("/")[-1]
-            if fnmatch.fnmatch(filename, pattern):
+            if glob.match(filename):
                 matched.append(file_path)
                 continue
             
             # Try matching with ** for recursive patterns
-            if "**" in pattern:
-                # Convert ** pattern to work with fnmatch
-                # e.g., "src/**/*.py" should match "src/foo/bar.py"
-                parts = pattern.split("**")
-                if len(parts) == 2:
-                    prefix, suffix = parts
-                    prefix = prefix.rstrip("/")
-                    suffix = suffix.lstrip("/")
-                    
-                    if file_path.startswith(prefix) and fnmatch.fnmatch(
-                        file_path[len(prefix):].lstrip("/"), f"*{suffix}"
-                    ):
-                        matched.append(file_path)
+            if recursive is not None:
+                prefix, suffix_glob = recursive
+                if file_path.startswith(prefix) and suffix_glob.match(
+                    file_path[len(prefix):].lstrip("/")
+                ):
+                    matched.append(file_path)
 
         return matched
 
@@ -209,9 +237,7 @@ class RuleMatcher:
         Returns:
             List of rule names referenced.
         """
-        import re
-        pattern = r"@(\w[\w\-]*)"
-        return re.findall(pattern, text)
+        return _MANUAL_REF_RE.findall(text)
 
     def extract_file_references(self, text: str) -> list[str]:
         """Extract file references from text.
@@ -227,20 +253,15 @@ class RuleMatcher:
         Returns:
             List of file paths found.
         """
-        import re
-        
         files = []
         
         # Match backtick-quoted file paths
-        backtick_pattern = r"`([^`]+\.\w+)`"
-        files.extend(re.findall(backtick_pattern, text))
+        files.extend(_BACKTICK_FILE_RE.findall(text))
         
         # Match file: prefix
-        file_prefix_pattern = r"file:([^\s]+)"
-        files.extend(re.findall(file_prefix_pattern, text))
+        files.extend(_FILE_PREFIX_RE.findall(text))
         
         # Match path: prefix
-        path_prefix_pattern = r"path:([^\s]+)"
-        files.extend(re.findall(path_prefix_pattern, text))
+        files.extend(_PATH_PREFIX_RE.findall(text))
         
         return files
@@ -15,6 +15,14 @@ from dataagent_core.rules.models import Rule, RuleMatch, RuleScope
 
 logger = logging.getLogger(__name__)
 
+# Conflict reasons depend only on the scope, so format them once
+_OVERRIDE_REASONS = {
+    scope: f"overridden by {scope.value} scope" for scope in RuleScope
+}
+_DUPLICATE_REASONS = {
+    scope: f"duplicate name, keeping {scope.value} scope" for scope in RuleScope
+}
+
 
 class RuleMerger:
     """Merges matched rules into a final list.
@@ -86,7 +94,7 @@ class RuleMerger:
                     conflicts.append((
                         rule.name,
                         existing.name,
-                        f"overridden by {rule.scope.value} scope"
+                        _OVERRIDE_REASONS[rule.scope],
                     ))
                     logger.debug(
                         f"Rule '{rule.name}' from {rule.scope.value} "
@@ -97,7 +105,7 @@ class RuleMerger:
                     conflicts.append((
                         rule.name,
                         existing.name,
-                        f"duplicate name, keeping {existing.scope.value} scope"
+                        _DUPLICATE_REASONS[existing.scope],
                     ))
                     logger.debug(
                         f"Rule '{rule.name}' conflict: keeping {existing.scope.value}, "
@@ -8,6 +8,7 @@ This module defines the core data structures for the rules system:
 - RuleEvaluationTrace: Trace information for debugging rule evaluation
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -42,7 +43,7 @@ class RuleInclusion(Enum):
     MANUAL = "manual"
 
 
-@dataclass
+@dataclass(slots=True)
 class Rule:
     """Agent rule model.
     
@@ -86,6 +87,11 @@ class Rule:
             raise ValueError("Rule description cannot be empty")
         if not 1 <= self.priority <= 100:
             raise ValueError(f"Priority must be between 1 and 100, got {self.priority}")
+        # Names are compared and hashed constantly during matching and
+        # merging; interning shares one string object per distinct name.
+        # sys.intern only accepts exact str, so other name types pass through.
+        if type(self.name) is str:
+            self.name = sys.intern(self.name)
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize rule to dictionary.
@@ -158,7 +164,7 @@ class Rule:
         return hash((self.name, self.scope))
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleMatch:
     """Result of matching a rule against context.
     
@@ -184,7 +190,7 @@ class RuleMatch:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleEvaluationTrace:
     """Trace information for rule evaluation.
     
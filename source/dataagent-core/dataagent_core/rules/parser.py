@@ -50,6 +50,9 @@ class RuleParser:
 
     # Pattern to match YAML frontmatter between --- delimiters
     FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n?", re.DOTALL)
+
+    # Pattern to match a single frontmatter "key: value" line
+    YAML_LINE_PATTERN = re.compile(r"^(\w+):\s*(.*)$")
     
     # Pattern to match file references: #[[file:path/to/file]]
     FILE_REFERENCE_PATTERN = re.compile(r"#\[\[file:([^\]]+)\]\]")
@@ -67,11 +70,11 @@ class RuleParser:
         Raises:
             RuleParseError: If the file is too large or has invalid format.
         """
-        if not file_path.exists():
+        # Check file size for security before reading anything
+        try:
+            file_size = file_path.stat().st_size
+        except (FileNotFoundError, NotADirectoryError):
             return None
-
-        # Check file size for security
-        file_size = file_path.stat().st_size
         if file_size > MAX_RULE_FILE_SIZE:
             raise RuleParseError(
                 f"Rule file exceeds size limit ({file_size} > {MAX_RULE_FILE_SIZE}): {file_path}"
@@ -106,15 +109,13 @@ class RuleParser:
             RuleParseError: If the content has invalid format or missing required fields.
         """
         # Parse YAML frontmatter
-        match = self.FRONTMATTER_PATTERN.match(content)
-        if not match:
+        parts = self._split_frontmatter(content)
+        if parts is None:
             raise RuleParseError(
                 "Missing or invalid YAML frontmatter. "
                 "Rule files must start with '---' followed by YAML metadata."
             )
-
-        frontmatter_text = match.group(1)
-        metadata = self._parse_yaml(frontmatter_text)
+        metadata, body = parts
 
         # Validate required fields
         if "name" not in metadata or not metadata["name"]:
@@ -123,7 +124,7 @@ class RuleParser:
             raise RuleParseError("Missing required field: description")
 
         # Extract Markdown content after frontmatter
-        rule_content = content[match.end():].strip()
+        rule_content = body.strip()
 
         # Parse inclusion mode
         inclusion_str = metadata.get("inclusion", "always")
@@ -167,6 +168,20 @@ class RuleParser:
             metadata=metadata,
         )
 
+    def _split_frontmatter(self, content: str) -> tuple[dict[str, Any], str] | None:
+        """Split rule content into frontmatter metadata and Markdown body.
+        
+        Args:
+            content: The full content of the rule file.
+            
+        Returns:
+            Tuple of (metadata, body), or None if there is no valid frontmatter.
+        """
+        match = self.FRONTMATTER_PATTERN.match(content)
+        if not match:
+            return None
+        return self._parse_yaml(match.group(1)), content[match.end():]
+
     def _parse_yaml(self, yaml_content: str) -> dict[str, Any]:
         """Parse simple YAML key-value pairs.
         
@@ -189,7 +204,7 @@ class RuleParser:
                 continue
             
             # Match key: value pattern
-            match = re.match(r"^(\w+):\s*(.*)$", line)
+            match = self.YAML_LINE_PATTERN.match(line)
             if match:
                 key, value = match.groups()
                 # Strip quotes from value
@@ -277,15 +292,10 @@ class RuleParser:
         """
         try:
             resolved = path.resolve()
-            for allowed in allowed_dirs:
-                try:
-                    allowed_resolved = allowed.resolve()
-                    resolved.relative_to(allowed_resolved)
-                    return True
-                except ValueError:
-                    # Path is not relative to this allowed dir
-                    continue
-            return False
+            return any(
+                resolved.is_relative_to(allowed.resolve())
+                for allowed in allowed_dirs
+            )
         except (OSError, RuntimeError):
             # Error resolving path (e.g., circular symlinks)
             return False
@@ -303,14 +313,13 @@ class RuleParser:
         warnings: list[str] = []
 
         # Check for frontmatter
-        match = self.FRONTMATTER_PATTERN.match(content)
-        if not match:
+        parts = self._split_frontmatter(content)
+        if parts is None:
             errors.append("Missing or invalid YAML frontmatter")
             return False, errors, warnings
 
-        # Parse and validate metadata
-        frontmatter_text = match.group(1)
-        metadata = self._parse_yaml(frontmatter_text)
+        # Validate metadata
+        metadata, rule_content = parts
 
         if "name" not in metadata or not metadata["name"]:
             errors.append("Missing required field: name")
@@ -333,7 +342,6 @@ class RuleParser:
                 warnings.append(f"Invalid priority value: {priority_str}")
 
         # Check content size
-        rule_content = content[match.end():]
         if len(rule_content) > 50000:
             warnings.append("Rule content is very large, may impact performance")
 
@@ -7,7 +7,9 @@ This module provides storage backends for rules:
 """
 
 import logging
+import os
 from abc import ABC, abstractmethod
+from dataclasses import replace
 from pathlib import Path
 from typing import Iterator
 
@@ -17,6 +19,14 @@ from dataagent_core.rules.parser import RuleParser, RuleParseError
 
 logger = logging.getLogger(__name__)
 
+# Scope lookup order when get_rule() is called without a scope
+_SCOPE_SEARCH_ORDER = (RuleScope.PROJECT, RuleScope.USER, RuleScope.GLOBAL)
+
+
+def _copy_rule(rule: Rule) -> Rule:
+    """Return a copy of a rule that shares no mutable state with it."""
+    return replace(rule, metadata=dict(rule.metadata))
+
 
 class RuleStore(ABC):
     """Abstract base class for rule storage.
@@ -132,6 +142,10 @@ class FileRuleStore(RuleStore):
         self.project_dir = project_dir
         self.parser = RuleParser()
         self._cache: dict[str, Rule] = {}
+        # Private parsed rules keyed by (path, scope), with the
+        # (mtime_ns, size) they were parsed at, so reload() only re-parses
+        # changed files. Callers only ever receive copies of these.
+        self._parsed: dict[tuple[Path, RuleScope], tuple[tuple[int, int], Rule]] = {}
         self._loaded = False
 
     def _ensure_loaded(self) -> None:
@@ -157,7 +171,7 @@ class FileRuleStore(RuleStore):
             return self._cache.get(key)
         
         # Search in priority order: project > user > global
-        for s in [RuleScope.PROJECT, RuleScope.USER, RuleScope.GLOBAL]:
+        for s in _SCOPE_SEARCH_ORDER:
             key = f"{s.value}:{name}"
             if key in self._cache:
                 return self._cache[key]
@@ -207,8 +221,18 @@ class FileRuleStore(RuleStore):
         return False
 
     def reload(self) -> None:
-        """Reload all rules from disk."""
+        """Reload all rules from disk.
+
+        Files whose modification time and size are unchanged since the
+        previous reload are not re-read; a fresh copy of their previously
+        parsed rule is returned instead, so unsaved in-memory edits to rules
+        handed out earlier do not survive a reload.
+
+        Note: the (st_mtime_ns, st_size) check misses a rewrite that keeps
+        the same size within one filesystem timestamp tick.
+        """
         self._cache.clear()
+        previous, self._parsed = self._parsed, {}
         
         # Load rules from each scope directory
         scope_dirs = [
@@ -219,20 +243,49 @@ class FileRuleStore(RuleStore):
         
         for scope, dir_path in scope_dirs:
             if dir_path and dir_path.exists():
-                for rule in self._load_rules_from_dir(dir_path, scope):
+                for rule in self._load_rules_from_dir(dir_path, scope, previous):
                     key = f"{scope.value}:{rule.name}"
                     self._cache[key] = rule
         
         self._loaded = True
         logger.debug(f"Loaded {len(self._cache)} rules")
 
-    def _load_rules_from_dir(self, dir_path: Path, scope: RuleScope) -> Iterator[Rule]:
-        """Load all rules from a directory."""
-        for file_path in dir_path.glob("*.md"):
+    def _load_rules_from_dir(
+        self,
+        dir_path: Path,
+        scope: RuleScope,
+        previous: dict[tuple[Path, RuleScope], tuple[tuple[int, int], Rule]],
+    ) -> Iterator[Rule]:
+        """Load all rules from a directory.
+
+        Args:
+            dir_path: Directory to scan for ``*.md`` rule files.
+            scope: The scope to assign to loaded rules.
+            previous: Parsed rules from the previous reload, reused for
+                files whose (mtime_ns, size) has not changed.
+        """
+        # scandir entries carry their file type, so non-files are skipped
+        # without an extra stat per entry.
+        with os.scandir(dir_path) as entries:
+            file_entries = [
+                entry
+                for entry in entries
+                if entry.name.endswith(".md") and entry.is_file()
+            ]
+
+        for entry in file_entries:
+            file_path = Path(entry.path)
             try:
-                rule = self.parser.parse_file(file_path, scope)
+                st = entry.stat()
+                signature = (st.st_mtime_ns, st.st_size)
+                cached = previous.get((file_path, scope))
+                if cached is not None and cached[0] == signature:
+                    rule = cached[1]
+                else:
+                    rule = self.parser.parse_file(file_path, scope)
                 if rule:
-                    yield rule
+                    self._parsed[(file_path, scope)] = (signature, rule)
+                    yield _copy_rule(rule)
             except RuleParseError as e:
                 logger.warning(f"Failed to parse rule file {file_path}: {e}")
             except Exception as e:
@@ -311,7 +364,7 @@ class MemoryRuleStore(RuleStore):
             return self._rules.get(key)
         
         # Search in priority order
-        for s in [RuleScope.PROJECT, RuleScope.USER, RuleScope.GLOBAL]:
+        for s in _SCOPE_SEARCH_ORDER:
             key = f"{s.value}:{name}"
             if key in self._rules:
                 return self._rules[key]
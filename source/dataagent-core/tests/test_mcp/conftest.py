@@ -0,0 +1,28 @@
+"""Shared fixtures for MCP tests."""
+
+from typing import Any
+
+import pytest
+
+
+class FakeMCPClient:
+    """In-process stand-in for MultiServerMCPClient.
+
+    Connects instantly without spawning the configured server process.
+    """
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        self.config = config
+        self.closed = False
+
+    async def get_tools(self) -> list:
+        return []
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_mcp_client():
+    """MCP client factory that never spawns subprocesses."""
+    return FakeMCPClient
@@ -204,6 +204,21 @@ class TestMCPConnectionManagerCreateConnection:
             assert connection.error is not None
             assert "Connection failed" in connection.error
 
+    @pytest.mark.asyncio
+    async def test_create_connection_uses_client_factory(self, fake_mcp_client):
+        """Test injected client factory is used instead of MultiServerMCPClient."""
+        manager = MCPConnectionManager(client_factory=fake_mcp_client)
+        server_config = MCPServerConfig(name="local", command="echo")
+
+        with patch("langchain_mcp_adapters.client.MultiServerMCPClient") as MockClient:
+            connection = await manager._create_connection(server_config)
+
+            MockClient.assert_not_called()
+
+        assert connection.connected is True
+        assert isinstance(connection.client, fake_mcp_client)
+        assert connection.client.config["local"]["command"] == "echo"
+
 
 class TestMCPConnectionManagerDisconnect:
     """Tests for MCPConnectionManager.disconnect()."""
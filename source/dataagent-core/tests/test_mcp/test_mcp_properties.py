@@ -6,6 +6,7 @@ These tests validate the correctness properties defined in the design document
 for the CLI MCP management feature.
 """
 
+import copy
 import json
 import tempfile
 from pathlib import Path
@@ -84,19 +85,18 @@ def mcp_server_config_strategy(draw):
         )
 
 
-@st.composite
-def mcp_config_strategy(draw, min_servers=0, max_servers=5):
-    """Generate random MCPConfig instances."""
-    num_servers = draw(st.integers(min_value=min_servers, max_value=max_servers))
-    servers = {}
-    
-    for i in range(num_servers):
-        server = draw(mcp_server_config_strategy())
-        # Ensure unique names by appending index
-        server.name = f"{server.name}_{i}"
-        servers[server.name] = server
-    
-    return MCPConfig(servers=servers)
+def mcp_config_strategy(min_servers=0, max_servers=5):
+    """Generate random MCPConfig instances.
+
+    Servers are drawn as a name-unique list so shrinking only has to drop
+    list elements instead of regenerating the whole server dict.
+    """
+    return st.lists(
+        mcp_server_config_strategy(),
+        min_size=min_servers,
+        max_size=max_servers,
+        unique_by=lambda server: server.name,
+    ).map(lambda servers: MCPConfig(servers={s.name: s for s in servers}))
 
 
 # =============================================================================
@@ -431,7 +431,7 @@ class TestUpdatePreservesOtherServers:
             
             # Capture state of other servers before update
             other_servers_before = {
-                name: loader.get_server(name).to_dict()
+                name: copy.deepcopy(loader.get_server(name))
                 for name in other_names
             }
             
@@ -440,8 +440,7 @@ class TestUpdatePreservesOtherServers:
             
             # Verify other servers unchanged
             for name in other_names:
-                server_after = loader.get_server(name).to_dict()
-                assert server_after == other_servers_before[name]
+                assert loader.get_server(name) == other_servers_before[name]
 
     @given(config=mcp_config_strategy(min_servers=2, max_servers=5))
     @settings(max_examples=100)
@@ -462,7 +461,7 @@ class TestUpdatePreservesOtherServers:
             
             # Capture state of other servers before removal
             other_servers_before = {
-                name: loader.get_server(name).to_dict()
+                name: copy.deepcopy(loader.get_server(name))
                 for name in other_names
             }
             
@@ -471,5 +470,4 @@ class TestUpdatePreservesOtherServers:
             
             # Verify other servers unchanged
             for name in other_names:
-                server_after = loader.get_server(name).to_dict()
-                assert server_after == other_servers_before[name]
+                assert loader.get_server(name) == other_servers_before[name]
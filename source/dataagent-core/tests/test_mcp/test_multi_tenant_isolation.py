@@ -1,5 +1,7 @@
 """Tests for MCP multi-tenant isolation."""
 
+import asyncio
+
 import pytest
 from dataagent_core.mcp import (
     MCPConfig,
@@ -9,6 +11,20 @@ from dataagent_core.mcp import (
 )
 
 
+def _mk_server(name: str, **env: str) -> MCPServerConfig:
+    """Build an npx-launched MCPServerConfig for the named server package."""
+    return MCPServerConfig(
+        name=name,
+        command="npx",
+        args=[f"@modelcontextprotocol/server-{name}"],
+        env=env,
+    )
+
+
+_ALICE_SERVERS = frozenset(("github", "postgres"))
+_BOB_SERVERS = frozenset(("github", "mysql", "jira"))
+
+
 class TestConfigIsolation:
     """Test configuration isolation between tenants."""
 
@@ -20,17 +36,9 @@ class TestConfigIsolation:
         # Tenant A adds servers
         config_a = MCPConfig(
             servers={
-                "github": MCPServerConfig(
-                    name="github",
-                    command="npx",
-                    args=["@modelcontextprotocol/server-github"],
-                    env={"GITHUB_TOKEN": "token_a"},
-                ),
-                "postgres": MCPServerConfig(
-                    name="postgres",
-                    command="npx",
-                    args=["@modelcontextprotocol/server-postgres"],
-                    env={"POSTGRES_CONNECTION_STRING": "postgresql://a"},
+                "github": _mk_server("github", GITHUB_TOKEN="token_a"),
+                "postgres": _mk_server(
+                    "postgres", POSTGRES_CONNECTION_STRING="postgresql://a"
                 ),
             }
         )
@@ -39,34 +47,21 @@ class TestConfigIsolation:
         # Tenant B adds different servers
         config_b = MCPConfig(
             servers={
-                "github": MCPServerConfig(
-                    name="github",
-                    command="npx",
-                    args=["@modelcontextprotocol/server-github"],
-                    env={"GITHUB_TOKEN": "token_b"},
-                ),
-                "mysql": MCPServerConfig(
-                    name="mysql",
-                    command="npx",
-                    args=["@modelcontextprotocol/server-mysql"],
-                    env={"MYSQL_CONNECTION_STRING": "mysql://b"},
-                ),
-                "jira": MCPServerConfig(
-                    name="jira",
-                    command="npx",
-                    args=["@modelcontextprotocol/server-jira"],
-                    env={"JIRA_TOKEN": "token_b"},
-                ),
+                "github": _mk_server("github", GITHUB_TOKEN="token_b"),
+                "mysql": _mk_server("mysql", MYSQL_CONNECTION_STRING="mysql://b"),
+                "jira": _mk_server("jira", JIRA_TOKEN="token_b"),
             }
         )
         await store.save_user_config("bob", config_b)
 
         # Verify isolation
-        alice_config = await store.get_user_config("alice")
-        bob_config = await store.get_user_config("bob")
+        alice_config, bob_config = await asyncio.gather(
+            store.get_user_config("alice"),
+            store.get_user_config("bob"),
+        )
 
-        assert set(alice_config.servers.keys()) == {"github", "postgres"}
-        assert set(bob_config.servers.keys()) == {"github", "mysql", "jira"}
+        assert alice_config.servers.keys() == _ALICE_SERVERS
+        assert bob_config.servers.keys() == _BOB_SERVERS
 
         # Verify credentials are isolated
         alice_github = alice_config.get_server("github")
@@ -82,14 +77,7 @@ class TestConfigIsolation:
 
         # Alice saves her config
         config_a = MCPConfig(
-            servers={
-                "github": MCPServerConfig(
-                    name="github",
-                    command="npx",
-                    args=["@modelcontextprotocol/server-github"],
-                    env={"GITHUB_TOKEN": "alice_secret_token"},
-                )
-            }
+            servers={"github": _mk_server("github", GITHUB_TOKEN="alice_secret_token")}
         )
         await store.save_user_config("alice", config_a)
 
@@ -105,26 +93,18 @@ class TestConfigIsolation:
         store = MemoryMCPConfigStore()
 
         # Alice adds a server
-        alice_server = MCPServerConfig(
-            name="slack",
-            command="npx",
-            args=["@modelcontextprotocol/server-slack"],
-            env={"SLACK_TOKEN": "alice_token"},
-        )
+        alice_server = _mk_server("slack", SLACK_TOKEN="alice_token")
         await store.add_server("alice", alice_server)
 
         # Bob adds a different server
-        bob_server = MCPServerConfig(
-            name="aws",
-            command="npx",
-            args=["@modelcontextprotocol/server-aws"],
-            env={"AWS_KEY": "bob_key"},
-        )
+        bob_server = _mk_server("aws", AWS_KEY="bob_key")
         await store.add_server("bob", bob_server)
 
         # Verify isolation
-        alice_config = await store.get_user_config("alice")
-        bob_config = await store.get_user_config("bob")
+        alice_config, bob_config = await asyncio.gather(
+            store.get_user_config("alice"),
+            store.get_user_config("bob"),
+        )
 
         assert "slack" in alice_config.servers
         assert "slack" not in bob_config.servers
@@ -137,28 +117,22 @@ class TestConfigIsolation:
         store = MemoryMCPConfigStore()
 
         # Both Alice and Bob have a GitHub server
-        alice_server = MCPServerConfig(
-            name="github",
-            command="npx",
-            args=["@modelcontextprotocol/server-github"],
-            env={"GITHUB_TOKEN": "alice_token"},
-        )
-        bob_server = MCPServerConfig(
-            name="github",
-            command="npx",
-            args=["@modelcontextprotocol/server-github"],
-            env={"GITHUB_TOKEN": "bob_token"},
-        )
+        alice_server = _mk_server("github", GITHUB_TOKEN="alice_token")
+        bob_server = _mk_server("github", GITHUB_TOKEN="bob_token")
 
-        await store.add_server("alice", alice_server)
-        await store.add_server("bob", bob_server)
+        await asyncio.gather(
+            store.add_server("alice", alice_server),
+            store.add_server("bob", bob_server),
+        )
 
         # Alice removes her GitHub server
         await store.remove_server("alice", "github")
 
         # Verify isolation
-        alice_config = await store.get_user_config("alice")
-        bob_config = await store.get_user_config("bob")
+        alice_config, bob_config = await asyncio.gather(
+            store.get_user_config("alice"),
+            store.get_user_config("bob"),
+        )
 
         assert "github" not in alice_config.servers
         assert "github" in bob_config.servers
@@ -167,11 +141,16 @@ class TestConfigIsolation:
 class TestConnectionIsolation:
     """Test connection isolation between tenants."""
 
+    @pytest.fixture
+    async def manager(self, fake_mcp_client):
+        """Create a connection manager and disconnect all tenants afterwards."""
+        manager = MCPConnectionManager(client_factory=fake_mcp_client)
+        yield manager
+        await manager.disconnect_all()
+
     @pytest.mark.asyncio
-    async def test_different_tenants_have_different_connections(self):
+    async def test_different_tenants_have_different_connections(self, manager):
         """Verify that different tenants have isolated connections."""
-        manager = MCPConnectionManager()
-
         # Create configs for Alice and Bob
         alice_config = MCPConfig(
             servers={
@@ -203,9 +182,12 @@ class TestConnectionIsolation:
         assert manager._connections["alice"] != manager._connections["bob"]
 
     @pytest.mark.asyncio
-    async def test_connection_limit_per_user(self):
+    async def test_connection_limit_per_user(self, fake_mcp_client):
         """Verify that connection limits are enforced per user."""
-        manager = MCPConnectionManager(max_connections_per_user=2)
+        manager = MCPConnectionManager(
+            max_connections_per_user=2,
+            client_factory=fake_mcp_client,
+        )
 
         # Create a config with 3 servers
         config = MCPConfig(
@@ -232,10 +214,8 @@ class TestConnectionIsolation:
         assert "bob" in manager._connections
 
     @pytest.mark.asyncio
-    async def test_disconnect_isolation(self):
+    async def test_disconnect_isolation(self, manager):
         """Verify that disconnecting one tenant doesn't affect others."""
-        manager = MCPConnectionManager()
-
         # Create configs
         alice_config = MCPConfig(
             servers={
@@ -257,13 +237,11 @@ class TestConnectionIsolation:
 
         # Verify isolation
         assert "alice" not in manager._connections
-        assert "bob" in manager._connections
+        assert "server2" in manager._connections["bob"]
 
     @pytest.mark.asyncio
-    async def test_get_tools_isolation(self):
+    async def test_get_tools_isolation(self, manager):
         """Verify that each tenant only gets their own tools."""
-        manager = MCPConnectionManager()
-
         # Create configs with different servers
         alice_config = MCPConfig(
             servers={
@@ -293,10 +271,8 @@ class TestConnectionIsolation:
         assert charlie_tools == []
 
     @pytest.mark.asyncio
-    async def test_connection_status_isolation(self):
+    async def test_connection_status_isolation(self, manager):
         """Verify that connection status is isolated per tenant."""
-        manager = MCPConnectionManager()
-
         # Create configs
         alice_config = MCPConfig(
             servers={
@@ -331,11 +307,12 @@ class TestResourceIsolation:
     """Test resource isolation between tenants."""
 
     @pytest.mark.asyncio
-    async def test_total_connection_limit(self):
+    async def test_total_connection_limit(self, fake_mcp_client):
         """Verify that total connection limit is enforced across all tenants."""
         manager = MCPConnectionManager(
             max_connections_per_user=100,
             max_total_connections=3,
+            client_factory=fake_mcp_client,
         )
 
         # Create configs
@@ -368,14 +345,13 @@ class TestResourceIsolation:
         # Try to connect a 4th tenant (should hit limit)
         await manager.connect("diana", config4)
 
-        # Verify that total connections don't exceed limit
-        total = manager.total_connections
-        assert total <= 3
+        # The fake client always connects, so the limit is reached exactly
+        assert manager.total_connections == 3
 
     @pytest.mark.asyncio
-    async def test_user_count(self):
+    async def test_user_count(self, fake_mcp_client):
         """Verify that user count is tracked correctly."""
-        manager = MCPConnectionManager()
+        manager = MCPConnectionManager(client_factory=fake_mcp_client)
 
         config = MCPConfig(
             servers={
@@ -398,102 +374,76 @@ class TestResourceIsolation:
         assert manager.get_user_count() == 2
 
 
+# (tenant, {server_name: env}) rows for the multi-tenant scenario
+_TENANT_TABLE = [
+    (
+        "alice",
+        {
+            "github": {"GITHUB_TOKEN": "alice_token"},
+            "postgres": {"POSTGRES_CONNECTION_STRING": "postgresql://alice"},
+            "slack": {"SLACK_TOKEN": "alice_slack"},
+        },
+    ),
+    (
+        "bob",
+        {
+            "github": {"GITHUB_TOKEN": "bob_token"},
+            "mysql": {"MYSQL_CONNECTION_STRING": "mysql://bob"},
+            "jira": {"JIRA_TOKEN": "bob_jira"},
+        },
+    ),
+    (
+        "charlie",
+        {
+            "github": {"GITHUB_TOKEN": "charlie_token"},
+            "aws": {"AWS_KEY": "charlie_key"},
+        },
+    ),
+]
+
+
+def _build_tenant_config(servers: dict[str, dict[str, str]]) -> MCPConfig:
+    """Build an MCPConfig from a `_TENANT_TABLE` row."""
+    return MCPConfig(
+        servers={
+            name: _mk_server(name, **env)
+            for name, env in servers.items()
+        }
+    )
+
+
 class TestMultiTenantScenarios:
     """Test realistic multi-tenant scenarios."""
 
-    @pytest.mark.asyncio
-    async def test_three_tenant_scenario(self):
-        """Test a realistic scenario with three tenants."""
+    @pytest.fixture
+    async def populated_store(self):
+        """Create a store holding the configs of all tenants in `_TENANT_TABLE`."""
         store = MemoryMCPConfigStore()
-        manager = MCPConnectionManager()
-
-        # Tenant A: Alice (GitHub + PostgreSQL + Slack)
-        alice_config = MCPConfig(
-            servers={
-                "github": MCPServerConfig(
-                    name="github",
-                    command="npx",
-                    env={"GITHUB_TOKEN": "alice_token"},
-                ),
-                "postgres": MCPServerConfig(
-                    name="postgres",
-                    command="npx",
-                    env={"POSTGRES_CONNECTION_STRING": "postgresql://alice"},
-                ),
-                "slack": MCPServerConfig(
-                    name="slack",
-                    command="npx",
-                    env={"SLACK_TOKEN": "alice_slack"},
-                ),
-            }
-        )
-        await store.save_user_config("alice", alice_config)
-
-        # Tenant B: Bob (GitHub + MySQL + Jira)
-        bob_config = MCPConfig(
-            servers={
-                "github": MCPServerConfig(
-                    name="github",
-                    command="npx",
-                    env={"GITHUB_TOKEN": "bob_token"},
-                ),
-                "mysql": MCPServerConfig(
-                    name="mysql",
-                    command="npx",
-                    env={"MYSQL_CONNECTION_STRING": "mysql://bob"},
-                ),
-                "jira": MCPServerConfig(
-                    name="jira",
-                    command="npx",
-                    env={"JIRA_TOKEN": "bob_jira"},
-                ),
-            }
-        )
-        await store.save_user_config("bob", bob_config)
+        await asyncio.gather(*(
+            store.save_user_config(user, _build_tenant_config(servers))
+            for user, servers in _TENANT_TABLE
+        ))
+        return store
 
-        # Tenant C: Charlie (GitHub + AWS)
-        charlie_config = MCPConfig(
-            servers={
-                "github": MCPServerConfig(
-                    name="github",
-                    command="npx",
-                    env={"GITHUB_TOKEN": "charlie_token"},
-                ),
-                "aws": MCPServerConfig(
-                    name="aws",
-                    command="npx",
-                    env={"AWS_KEY": "charlie_key"},
-                ),
-            }
-        )
-        await store.save_user_config("charlie", charlie_config)
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("user,expected", _TENANT_TABLE)
+    async def test_three_tenant_scenario(self, populated_store, user, expected):
+        """Test a realistic scenario with three tenants."""
+        stored = await populated_store.get_user_config(user)
 
         # Verify configuration isolation
-        alice_stored = await store.get_user_config("alice")
-        bob_stored = await store.get_user_config("bob")
-        charlie_stored = await store.get_user_config("charlie")
-
-        assert set(alice_stored.servers.keys()) == {"github", "postgres", "slack"}
-        assert set(bob_stored.servers.keys()) == {"github", "mysql", "jira"}
-        assert set(charlie_stored.servers.keys()) == {"github", "aws"}
+        assert stored.servers.keys() == expected.keys()
 
         # Verify credential isolation
-        alice_github = alice_stored.get_server("github")
-        bob_github = bob_stored.get_server("github")
-        charlie_github = charlie_stored.get_server("github")
-
-        assert alice_github.env["GITHUB_TOKEN"] == "alice_token"
-        assert bob_github.env["GITHUB_TOKEN"] == "bob_token"
-        assert charlie_github.env["GITHUB_TOKEN"] == "charlie_token"
-
-        # Verify that Alice doesn't have Jira or AWS
-        assert alice_stored.get_server("jira") is None
-        assert alice_stored.get_server("aws") is None
-
-        # Verify that Bob doesn't have Slack or AWS
-        assert bob_stored.get_server("slack") is None
-        assert bob_stored.get_server("aws") is None
-
-        # Verify that Charlie doesn't have Slack or Jira
-        assert charlie_stored.get_server("slack") is None
-        assert charlie_stored.get_server("jira") is None
+        for name, env in expected.items():
+            assert stored.get_server(name).env == env
+
+        # Verify that servers owned only by other tenants are not visible
+        foreign = {
+            name
+            for other, servers in _TENANT_TABLE
+            if other != user
+            for name in servers
+        } - expected.keys()
+        for name in foreign:
+            assert stored.get_server(name) is None
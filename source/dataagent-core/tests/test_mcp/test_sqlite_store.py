@@ -3,9 +3,6 @@
 Tests for SQLiteMCPConfigStore with transport, headers support.
 """
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
 from dataagent_core.mcp.config import MCPServerConfig, MCPConfig
@@ -14,26 +11,22 @@ from dataagent_core.mcp.sqlite_store import SQLiteMCPConfigStore
 
 @pytest.fixture
 async def sqlite_store():
-    """Create a temporary SQLite store for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        store = SQLiteMCPConfigStore(db_path=db_path)
-        await store.init_tables()
-        yield store
-        await store.close()
+    """Create an in-memory SQLite store for testing."""
+    store = SQLiteMCPConfigStore(db_path=SQLiteMCPConfigStore.IN_MEMORY)
+    await store.init_tables()
+    yield store
+    await store.close()
 
 
 class TestSQLiteMCPConfigStoreBasic:
     """Basic tests for SQLiteMCPConfigStore."""
 
-    @pytest.mark.asyncio
     async def test_init_tables(self, sqlite_store):
         """Test table initialization."""
         # Table should be created by fixture
         config = await sqlite_store.get_user_config("test_user")
         assert config.servers == {}
 
-    @pytest.mark.asyncio
     async def test_add_server(self, sqlite_store):
         """Test adding a server."""
         server = MCPServerConfig(
@@ -47,7 +40,6 @@ class TestSQLiteMCPConfigStoreBasic:
         assert "test-server" in config.servers
         assert config.servers["test-server"].command == "uvx"
 
-    @pytest.mark.asyncio
     async def test_get_server(self, sqlite_store):
         """Test getting a specific server."""
         server = MCPServerConfig(
@@ -64,13 +56,25 @@ class TestSQLiteMCPConfigStoreBasic:
         assert result.args == ["arg1", "arg2"]
         assert result.env == {"KEY": "value"}
 
-    @pytest.mark.asyncio
+    async def test_get_server_non_ascii_values(self, sqlite_store):
+        """Test JSON columns round-trip non-ASCII values."""
+        server = MCPServerConfig(
+            name="test",
+            command="uvx",
+            args=["--标签", "数据"],
+            env={"GREETING": "你好"},
+        )
+        await sqlite_store.add_server("user1", server)
+
+        result = await sqlite_store.get_server("user1", "test")
+        assert result.args == ["--标签", "数据"]
+        assert result.env == {"GREETING": "你好"}
+
     async def test_get_nonexistent_server(self, sqlite_store):
         """Test getting nonexistent server returns None."""
         result = await sqlite_store.get_server("user1", "nonexistent")
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_remove_server(self, sqlite_store):
         """Test removing a server."""
         server = MCPServerConfig(name="test", command="uvx")
@@ -82,13 +86,11 @@ class TestSQLiteMCPConfigStoreBasic:
         config = await sqlite_store.get_user_config("user1")
         assert "test" not in config.servers
 
-    @pytest.mark.asyncio
     async def test_remove_nonexistent_server(self, sqlite_store):
         """Test removing nonexistent server returns False."""
         result = await sqlite_store.remove_server("user1", "nonexistent")
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_update_server(self, sqlite_store):
         """Test updating an existing server (upsert)."""
         server1 = MCPServerConfig(name="test", command="uvx", args=["v1"])
@@ -101,11 +103,12 @@ class TestSQLiteMCPConfigStoreBasic:
         assert result.command == "npx"
         assert result.args == ["v2"]
 
-    @pytest.mark.asyncio
     async def test_delete_user_config(self, sqlite_store):
         """Test deleting all config for a user."""
-        await sqlite_store.add_server("user1", MCPServerConfig(name="s1", command="uvx"))
-        await sqlite_store.add_server("user1", MCPServerConfig(name="s2", command="npx"))
+        await sqlite_store.bulk_add_servers("user1", [
+            MCPServerConfig(name="s1", command="uvx"),
+            MCPServerConfig(name="s2", command="npx"),
+        ])
 
         result = await sqlite_store.delete_user_config("user1")
         assert result is True
@@ -113,11 +116,43 @@ class TestSQLiteMCPConfigStoreBasic:
         config = await sqlite_store.get_user_config("user1")
         assert config.servers == {}
 
+    async def test_bulk_add_servers(self, sqlite_store):
+        """Test adding several servers at once, including an upsert."""
+        await sqlite_store.add_server("user1", MCPServerConfig(name="s1", command="uvx"))
+
+        await sqlite_store.bulk_add_servers("user1", [
+            MCPServerConfig(name="s1", command="npx"),
+            MCPServerConfig(name="s2", url="http://localhost:8080/mcp"),
+        ])
+
+        config = await sqlite_store.get_user_config("user1")
+        assert set(config.servers) == {"s1", "s2"}
+        assert config.servers["s1"].command == "npx"
+        assert config.servers["s2"].url == "http://localhost:8080/mcp"
+
+    async def test_bulk_add_servers_empty(self, sqlite_store):
+        """Test adding an empty server list is a no-op."""
+        await sqlite_store.bulk_add_servers("user1", [])
+
+        config = await sqlite_store.get_user_config("user1")
+        assert config.servers == {}
+
+    async def test_save_user_config_replaces_servers(self, sqlite_store):
+        """Test saving a config replaces the user's existing servers."""
+        await sqlite_store.add_server("user1", MCPServerConfig(name="old", command="uvx"))
+
+        await sqlite_store.save_user_config("user1", MCPConfig(servers={
+            "a": MCPServerConfig(name="a", command="uvx"),
+            "b": MCPServerConfig(name="b", command="npx"),
+        }))
+
+        config = await sqlite_store.get_user_config("user1")
+        assert set(config.servers) == {"a", "b"}
+
 
 class TestSQLiteMCPConfigStoreURLServers:
     """Tests for SQLiteMCPConfigStore with URL-based servers."""
 
-    @pytest.mark.asyncio
     async def test_add_url_server(self, sqlite_store):
         """Test adding a URL-based server."""
         server = MCPServerConfig(
@@ -129,7 +164,6 @@ class TestSQLiteMCPConfigStoreURLServers:
         result = await sqlite_store.get_server("user1", "remote")
         assert result.url == "http://localhost:8080/mcp"
 
-    @pytest.mark.asyncio
     async def test_add_server_with_transport(self, sqlite_store):
         """Test adding server with transport type."""
         server = MCPServerConfig(
@@ -142,7 +176,6 @@ class TestSQLiteMCPConfigStoreURLServers:
         result = await sqlite_store.get_server("user1", "remote")
         assert result.transport == "streamable_http"
 
-    @pytest.mark.asyncio
     async def test_add_server_with_headers(self, sqlite_store):
         """Test adding server with custom headers."""
         headers = {
@@ -159,7 +192,6 @@ class TestSQLiteMCPConfigStoreURLServers:
         result = await sqlite_store.get_server("user1", "remote")
         assert result.headers == headers
 
-    @pytest.mark.asyncio
     async def test_add_server_full_config(self, sqlite_store):
         """Test adding server with all URL options."""
         server = MCPServerConfig(
@@ -183,7 +215,6 @@ class TestSQLiteMCPConfigStoreURLServers:
         assert result.headers["X-Database-Host"] == "db.example.com"
         assert result.auto_approve == ["query_sql", "list_tables"]
 
-    @pytest.mark.asyncio
     async def test_default_transport_is_sse(self, sqlite_store):
         """Test default transport is 'sse' when not specified."""
         server = MCPServerConfig(
@@ -195,7 +226,6 @@ class TestSQLiteMCPConfigStoreURLServers:
         result = await sqlite_store.get_server("user1", "remote")
         assert result.transport == "sse"
 
-    @pytest.mark.asyncio
     async def test_empty_headers(self, sqlite_store):
         """Test server with empty headers."""
         server = MCPServerConfig(
@@ -209,103 +239,127 @@ class TestSQLiteMCPConfigStoreURLServers:
         assert result.headers == {}
 
 
+# Server kind -> factory building that kind of server for a given user
+_ISOLATION_SERVERS = {
+    "command": lambda user: MCPServerConfig(
+        name="server",
+        command="uvx",
+        args=[f"mcp-server-{user}"],
+        env={"TOKEN": f"{user}-token"},
+    ),
+    "url": lambda user: MCPServerConfig(
+        name="server",
+        url=f"http://{user}.example.com/mcp",
+    ),
+    "full": lambda user: MCPServerConfig(
+        name="server",
+        url=f"http://{user}.example.com/mcp",
+        transport="streamable_http",
+        headers={"X-Secret": f"{user}-secret"},
+        auto_approve=["query_sql"],
+    ),
+}
+
+
 class TestSQLiteMCPConfigStoreIsolation:
     """Tests for user isolation in SQLiteMCPConfigStore."""
 
-    @pytest.mark.asyncio
-    async def test_user_configs_isolated(self, sqlite_store):
-        """Test different users have isolated configs."""
-        await sqlite_store.add_server("user1", MCPServerConfig(
-            name="server",
-            url="http://user1.example.com/mcp",
-        ))
-        await sqlite_store.add_server("user2", MCPServerConfig(
-            name="server",
-            url="http://user2.example.com/mcp",
-        ))
+    @pytest.mark.parametrize("kind", list(_ISOLATION_SERVERS))
+    async def test_user_isolation(self, sqlite_store, kind):
+        """Test users only see, and only delete, their own servers."""
+        make_server = _ISOLATION_SERVERS[kind]
+        await sqlite_store.add_server("user1", make_server("user1"))
+        await sqlite_store.add_server("user2", make_server("user2"))
+
+        # Same server name, isolated per user
+        assert await sqlite_store.get_server("user1", "server") == make_server("user1")
+        assert await sqlite_store.get_server("user2", "server") == make_server("user2")
+
+        # A user without the server cannot reach another user's copy
+        assert await sqlite_store.get_server("user3", "server") is None
+
+        # Deleting one user's config does not affect others
+        await sqlite_store.delete_user_config("user1")
 
         config1 = await sqlite_store.get_user_config("user1")
         config2 = await sqlite_store.get_user_config("user2")
+        assert config1.servers == {}
+        assert config2.servers == {"server": make_server("user2")}
 
-        assert config1.servers["server"].url == "http://user1.example.com/mcp"
-        assert config2.servers["server"].url == "http://user2.example.com/mcp"
 
-    @pytest.mark.asyncio
-    async def test_user_cannot_access_other_user_server(self, sqlite_store):
-        """Test user cannot access another user's server."""
-        await sqlite_store.add_server("user1", MCPServerConfig(
-            name="secret",
-            url="http://secret.example.com/mcp",
-            headers={"X-Secret": "user1-secret"},
-        ))
+class TestSQLiteMCPConfigStorePersistence:
+    """Tests for SQLiteMCPConfigStore persistence."""
 
-        result = await sqlite_store.get_server("user2", "secret")
-        assert result is None
+    async def test_connection_pragmas(self, tmp_path):
+        """Test file databases use WAL journaling and relaxed syncing."""
+        from sqlalchemy import text
 
-    @pytest.mark.asyncio
-    async def test_delete_user_config_does_not_affect_others(self, sqlite_store):
-        """Test deleting user config doesn't affect other users."""
-        await sqlite_store.add_server("user1", MCPServerConfig(name="s1", command="uvx"))
-        await sqlite_store.add_server("user2", MCPServerConfig(name="s2", command="npx"))
+        store = SQLiteMCPConfigStore(db_path=tmp_path / "test.db")
+        async with store._engine.connect() as conn:
+            journal_mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+            synchronous = (await conn.execute(text("PRAGMA synchronous"))).scalar()
+        await store.close()
 
-        await sqlite_store.delete_user_config("user1")
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
 
-        config2 = await sqlite_store.get_user_config("user2")
-        assert "s2" in config2.servers
+    async def test_in_memory_store_is_private(self):
+        """Test in-memory stores do not share data with each other."""
+        store1 = SQLiteMCPConfigStore(db_path=SQLiteMCPConfigStore.IN_MEMORY)
+        store2 = SQLiteMCPConfigStore(db_path=SQLiteMCPConfigStore.IN_MEMORY)
+        await store1.add_server("user1", MCPServerConfig(name="s1", command="uvx"))
 
+        assert await store1.get_server("user1", "s1") is not None
+        assert await store2.get_server("user1", "s1") is None
 
-class TestSQLiteMCPConfigStorePersistence:
-    """Tests for SQLiteMCPConfigStore persistence."""
+        await store1.close()
+        await store2.close()
 
-    @pytest.mark.asyncio
-    async def test_data_persists_across_instances(self):
+    async def test_data_persists_across_instances(self, tmp_path):
         """Test data persists when store is reopened."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-
-            # First instance: add data
-            store1 = SQLiteMCPConfigStore(db_path=db_path)
-            await store1.init_tables()
-            await store1.add_server("user1", MCPServerConfig(
-                name="persistent",
-                url="http://localhost:8080/mcp",
-                transport="streamable_http",
-                headers={"X-Key": "value"},
-            ))
-            await store1.close()
-
-            # Second instance: verify data
-            store2 = SQLiteMCPConfigStore(db_path=db_path)
-            await store2.init_tables()
-            result = await store2.get_server("user1", "persistent")
-            await store2.close()
-
-            assert result is not None
-            assert result.url == "http://localhost:8080/mcp"
-            assert result.transport == "streamable_http"
-            assert result.headers == {"X-Key": "value"}
-
-    @pytest.mark.asyncio
-    async def test_migration_adds_new_columns(self):
+        db_path = tmp_path / "test.db"
+
+        # First instance: add data
+        store1 = SQLiteMCPConfigStore(db_path=db_path)
+        await store1.init_tables()
+        await store1.add_server("user1", MCPServerConfig(
+            name="persistent",
+            url="http://localhost:8080/mcp",
+            transport="streamable_http",
+            headers={"X-Key": "value"},
+        ))
+        await store1.close()
+
+        # Second instance: verify data
+        store2 = SQLiteMCPConfigStore(db_path=db_path)
+        await store2.init_tables()
+        result = await store2.get_server("user1", "persistent")
+        await store2.close()
+
+        assert result is not None
+        assert result.url == "http://localhost:8080/mcp"
+        assert result.transport == "streamable_http"
+        assert result.headers == {"X-Key": "value"}
+
+    async def test_migration_adds_new_columns(self, tmp_path):
         """Test migration adds new columns to existing table."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-
-            # Create store and add data
-            store = SQLiteMCPConfigStore(db_path=db_path)
-            await store.init_tables()
-
-            # Add server with all new fields
-            await store.add_server("user1", MCPServerConfig(
-                name="test",
-                url="http://localhost:8080/mcp",
-                transport="streamable_http",
-                headers={"X-Key": "value"},
-            ))
-
-            # Verify
-            result = await store.get_server("user1", "test")
-            assert result.transport == "streamable_http"
-            assert result.headers == {"X-Key": "value"}
-
-            await store.close()
+        db_path = tmp_path / "test.db"
+
+        # Create store and add data
+        store = SQLiteMCPConfigStore(db_path=db_path)
+        await store.init_tables()
+
+        # Add server with all new fields
+        await store.add_server("user1", MCPServerConfig(
+            name="test",
+            url="http://localhost:8080/mcp",
+            transport="streamable_http",
+            headers={"X-Key": "value"},
+        ))
+
+        # Verify
+        result = await store.get_server("user1", "test")
+        assert result.transport == "streamable_http"
+        assert result.headers == {"X-Key": "value"}
+
+        await store.close()
@@ -5,19 +5,37 @@
 **Validates: Requirements 14.1, 14.2, 14.3, 14.4, 14.5**
 """
 
+from dataclasses import replace
+
 import pytest
 from hypothesis import given, strategies as st, settings
 
 from dataagent_core.rules.models import Rule, RuleScope, RuleInclusion
 from dataagent_core.rules.conflict import ConflictDetector, RuleConflict, ConflictReport
 
+# Deterministic examples and no per-example deadline for the property tests.
+_HYPOTHESIS_SETTINGS = settings(max_examples=50, deadline=None, derandomize=True)
+
+# Base rule cloned by the property tests
+_RULE_TEMPLATE = Rule(
+    name="template",
+    description="Template rule",
+    content="Template content",
+    scope=RuleScope.USER,
+)
+
+
+@pytest.fixture(scope="module")
+def detector() -> ConflictDetector:
+    """Shared ConflictDetector; the detector holds no per-call state."""
+    return ConflictDetector()
+
 
 class TestConflictDetectorBasic:
     """Basic tests for ConflictDetector."""
 
-    def test_no_conflicts_with_unique_names(self) -> None:
+    def test_no_conflicts_with_unique_names(self, detector: ConflictDetector) -> None:
         """Test that no conflicts are detected with unique rule names."""
-        detector = ConflictDetector()
         rules = [
             Rule(
                 name="rule1",
@@ -38,9 +56,8 @@ class TestConflictDetectorBasic:
         assert not report.has_conflicts()
         assert len(report.conflicts) == 0
 
-    def test_detects_same_name_conflict(self) -> None:
+    def test_detects_same_name_conflict(self, detector: ConflictDetector) -> None:
         """Test detection of same-name conflicts across scopes."""
-        detector = ConflictDetector()
         rules = [
             Rule(
                 name="shared-rule",
@@ -65,9 +82,11 @@ class TestConflictDetectorBasic:
         assert conflict.rule1_scope == RuleScope.USER  # Higher priority wins
         assert conflict.rule2_scope == RuleScope.GLOBAL
 
-    def test_detects_multiple_same_name_conflicts(self) -> None:
+    def test_detects_multiple_same_name_conflicts(
+        self,
+        detector: ConflictDetector,
+    ) -> None:
         """Test detection of multiple same-name conflicts."""
-        detector = ConflictDetector()
         rules = [
             Rule(
                 name="multi-rule",
@@ -95,9 +114,8 @@ class TestConflictDetectorBasic:
         # Project wins over both User and Global
         assert len(report.conflicts) == 2
 
-    def test_scope_priority_in_resolution(self) -> None:
+    def test_scope_priority_in_resolution(self, detector: ConflictDetector) -> None:
         """Test that higher scope priority wins in conflict resolution."""
-        detector = ConflictDetector()
         rules = [
             Rule(
                 name="priority-rule",
@@ -121,13 +139,48 @@ class TestConflictDetectorBasic:
         assert conflict.rule1_scope == RuleScope.SESSION
         assert "session scope takes precedence" in conflict.resolution.lower()
 
+    def test_rule_priority_in_same_scope_resolution(
+        self,
+        detector: ConflictDetector,
+    ) -> None:
+        """Test that rule priority picks the winner within one scope."""
+        low = replace(_RULE_TEMPLATE, name="dup-rule", priority=20)
+        high = replace(_RULE_TEMPLATE, name="dup-rule", priority=80)
+        
+        for rules in ([low, high], [high, low]):
+            report = detector.detect_conflicts(rules)
+            
+            assert len(report.conflicts) == 1
+            conflict = report.conflicts[0]
+            assert conflict.rule1_scope == conflict.rule2_scope == RuleScope.USER
+            assert conflict.resolution == "priority 80 takes precedence over priority 20"
+
+    def test_empty_and_single_rule_have_no_conflicts(
+        self,
+        detector: ConflictDetector,
+    ) -> None:
+        """Test that fewer than two rules yield a fresh, empty report."""
+        rule = Rule(
+            name="solo",
+            description="Solo",
+            content="Always allow everything",
+            scope=RuleScope.USER,
+        )
+        
+        empty_report = detector.detect_conflicts([])
+        single_report = detector.detect_conflicts([rule])
+        
+        assert not empty_report.has_conflicts()
+        assert not single_report.has_conflicts()
+        assert single_report.warnings == []
+        assert empty_report is not single_report
+
 
 class TestContradictoryRuleDetection:
     """Tests for contradictory rule detection."""
 
-    def test_detects_allow_deny_contradiction(self) -> None:
+    def test_detects_allow_deny_contradiction(self, detector: ConflictDetector) -> None:
         """Test detection of allow/deny contradictions."""
-        detector = ConflictDetector()
         rules = [
             Rule(
                 name="allow-rule",
@@ -149,9 +202,11 @@ class TestContradictoryRuleDetection:
         assert len(report.warnings) > 0
         assert any("contradiction" in w.lower() for w in report.warnings)
 
-    def test_no_warning_for_non_contradictory_rules(self) -> None:
+    def test_no_warning_for_non_contradictory_rules(
+        self,
+        detector: ConflictDetector,
+    ) -> None:
         """Test that non-contradictory rules don't trigger warnings."""
-        detector = ConflictDetector()
         rules = [
             Rule(
                 name="rule1",
@@ -227,9 +282,8 @@ class TestRuleConflict:
 class TestGetWinningRule:
     """Tests for get_winning_rule method."""
 
-    def test_returns_highest_scope_priority(self) -> None:
+    def test_returns_highest_scope_priority(self, detector: ConflictDetector) -> None:
         """Test that highest scope priority rule wins."""
-        detector = ConflictDetector()
         rules = [
             Rule(
                 name="rule",
@@ -250,17 +304,17 @@ class TestGetWinningRule:
         assert winner is not None
         assert winner.scope == RuleScope.PROJECT
 
-    def test_returns_none_for_empty_list(self) -> None:
+    def test_returns_none_for_empty_list(self, detector: ConflictDetector) -> None:
         """Test that None is returned for empty list."""
-        detector = ConflictDetector()
-        
         winner = detector.get_winning_rule([])
         
         assert winner is None
 
-    def test_considers_rule_priority_within_scope(self) -> None:
+    def test_considers_rule_priority_within_scope(
+        self,
+        detector: ConflictDetector,
+    ) -> None:
         """Test that rule priority is considered within same scope."""
-        detector = ConflictDetector()
         rules = [
             Rule(
                 name="rule",
@@ -290,21 +344,24 @@ class TestConflictDetectorPropertyTests:
     @given(
         num_rules=st.integers(min_value=0, max_value=10),
     )
-    @settings(max_examples=50)
-    def test_conflict_count_matches_duplicate_names(self, num_rules: int) -> None:
+    @_HYPOTHESIS_SETTINGS
+    def test_conflict_count_matches_duplicate_names(
+        self,
+        detector: ConflictDetector,
+        num_rules: int,
+    ) -> None:
         """
         **Property 14: Conflict Detection Accuracy**
         
         The number of conflicts should match the number of duplicate names.
         """
-        detector = ConflictDetector()
-        
         # Create rules with same name at different scopes
         scopes = [RuleScope.GLOBAL, RuleScope.USER, RuleScope.PROJECT]
         rules = []
         for i in range(min(num_rules, len(scopes))):
             rules.append(
-                Rule(
+                replace(
+                    _RULE_TEMPLATE,
                     name="same-name",
                     description=f"Rule {i}",
                     content=f"Content {i}",
@@ -323,24 +380,24 @@ class TestConflictDetectorPropertyTests:
             st.text(min_size=1, max_size=20, alphabet="abcdefghijklmnopqrstuvwxyz"),
             min_size=0,
             max_size=10,
+            unique=True,
         )
     )
-    @settings(max_examples=50)
-    def test_unique_names_no_conflicts(self, names: list[str]) -> None:
+    @_HYPOTHESIS_SETTINGS
+    def test_unique_names_no_conflicts(
+        self,
+        detector: ConflictDetector,
+        names: list[str],
+    ) -> None:
         """Test that unique names produce no conflicts."""
-        detector = ConflictDetector()
-        
-        # Make names unique
-        unique_names = list(set(names))
-        
         rules = [
-            Rule(
+            replace(
+                _RULE_TEMPLATE,
                 name=name,
                 description=f"Rule {name}",
                 content=f"Content for {name}",
-                scope=RuleScope.USER,
             )
-            for name in unique_names
+            for name in names
         ]
         
         report = detector.detect_conflicts(rules)
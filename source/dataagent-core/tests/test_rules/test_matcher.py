@@ -6,11 +6,41 @@
 **Validates: Requirements 3.1, 3.2, 3.3, 3.4, 3.6**
 """
 
+from collections import Counter
+from dataclasses import replace
+
 import pytest
 from hypothesis import given, strategies as st, settings
 
 from dataagent_core.rules.models import Rule, RuleScope, RuleInclusion, RuleMatch
-from dataagent_core.rules.matcher import RuleMatcher, MatchContext
+from dataagent_core.rules.matcher import RuleMatcher, MatchContext, _compile_glob
+
+# Deterministic examples and no per-example deadline, so first-call glob and
+# regex compilation cannot trip a timeout.
+_HYPOTHESIS_SETTINGS = settings(max_examples=100, deadline=None, derandomize=True)
+
+# Rule names drawn from unicode letters, digits, "_" and "-" (as in
+# test_models.py). None of these characters is whitespace, so no examples
+# are discarded by a filter.
+_rule_names = st.text(
+    alphabet=st.characters(whitelist_categories=("L", "N"), whitelist_characters="_-"),
+    min_size=1,
+    max_size=20,
+)
+
+
+@pytest.fixture(scope="module")
+def matcher() -> RuleMatcher:
+    """Shared RuleMatcher; the matcher holds no per-call state."""
+    return RuleMatcher()
+
+
+_RULE_TEMPLATE = Rule(
+    name="test",
+    description="Test rule",
+    content="Test content",
+    scope=RuleScope.USER,
+)
 
 
 def create_rule(
@@ -19,12 +49,10 @@ def create_rule(
     file_match_pattern: str | None = None,
     enabled: bool = True,
 ) -> Rule:
-    """Helper to create test rules."""
-    return Rule(
+    """Helper to create test rules from a shared template."""
+    return replace(
+        _RULE_TEMPLATE,
         name=name,
-        description="Test rule",
-        content="Test content",
-        scope=RuleScope.USER,
         inclusion=inclusion,
         file_match_pattern=file_match_pattern,
         enabled=enabled,
@@ -34,9 +62,8 @@ def create_rule(
 class TestRuleMatcherBasic:
     """Basic tests for RuleMatcher."""
 
-    def test_match_always_rule(self) -> None:
+    def test_match_always_rule(self, matcher: RuleMatcher) -> None:
         """Test that always rules are always matched."""
-        matcher = RuleMatcher()
         rule = create_rule(inclusion=RuleInclusion.ALWAYS)
         context = MatchContext()
         
@@ -46,9 +73,8 @@ class TestRuleMatcherBasic:
         assert matched[0].rule == rule
         assert "always" in matched[0].match_reason
 
-    def test_match_manual_rule_referenced(self) -> None:
+    def test_match_manual_rule_referenced(self, matcher: RuleMatcher) -> None:
         """Test that manual rules match when referenced."""
-        matcher = RuleMatcher()
         rule = create_rule(name="my-rule", inclusion=RuleInclusion.MANUAL)
         context = MatchContext(manual_rules=["my-rule"])
         
@@ -57,9 +83,8 @@ class TestRuleMatcherBasic:
         assert len(matched) == 1
         assert matched[0].rule == rule
 
-    def test_skip_manual_rule_not_referenced(self) -> None:
+    def test_skip_manual_rule_not_referenced(self, matcher: RuleMatcher) -> None:
         """Test that manual rules are skipped when not referenced."""
-        matcher = RuleMatcher()
         rule = create_rule(name="my-rule", inclusion=RuleInclusion.MANUAL)
         context = MatchContext(manual_rules=[])
         
@@ -69,9 +94,8 @@ class TestRuleMatcherBasic:
         assert len(skipped) == 1
         assert skipped[0][0] == "my-rule"
 
-    def test_match_file_pattern(self) -> None:
+    def test_match_file_pattern(self, matcher: RuleMatcher) -> None:
         """Test file pattern matching."""
-        matcher = RuleMatcher()
         rule = create_rule(
             inclusion=RuleInclusion.FILE_MATCH,
             file_match_pattern="*.py",
@@ -83,9 +107,8 @@ class TestRuleMatcherBasic:
         assert len(matched) == 1
         assert "main.py" in matched[0].matched_files
 
-    def test_skip_file_pattern_no_match(self) -> None:
+    def test_skip_file_pattern_no_match(self, matcher: RuleMatcher) -> None:
         """Test that file pattern rules are skipped when no files match."""
-        matcher = RuleMatcher()
         rule = create_rule(
             inclusion=RuleInclusion.FILE_MATCH,
             file_match_pattern="*.py",
@@ -97,9 +120,8 @@ class TestRuleMatcherBasic:
         assert len(matched) == 0
         assert len(skipped) == 1
 
-    def test_skip_disabled_rule(self) -> None:
+    def test_skip_disabled_rule(self, matcher: RuleMatcher) -> None:
         """Test that disabled rules are skipped."""
-        matcher = RuleMatcher()
         rule = create_rule(enabled=False)
         context = MatchContext()
         
@@ -115,21 +137,24 @@ class TestRuleMatcherPropertyTests:
 
     @given(
         rule_names=st.lists(
-            st.text(min_size=1, max_size=20).filter(lambda x: x.strip() != ""),
+            _rule_names,
             min_size=1,
             max_size=10,
             unique=True,
         )
     )
-    @settings(max_examples=100)
-    def test_always_inclusion_guarantee(self, rule_names: list[str]) -> None:
+    @_HYPOTHESIS_SETTINGS
+    def test_always_inclusion_guarantee(
+        self,
+        matcher: RuleMatcher,
+        rule_names: list[str],
+    ) -> None:
         """
         **Feature: agent-rules, Property 5: Always Inclusion Guarantee**
         
         For any rule with inclusion mode "always", the rule shall be included
         in the matched rules list regardless of the match context.
         """
-        matcher = RuleMatcher()
         rules = [
             create_rule(name=name, inclusion=RuleInclusion.ALWAYS)
             for name in rule_names
@@ -139,9 +164,7 @@ class TestRuleMatcherPropertyTests:
         context = MatchContext()
         matched, _ = matcher.match_rules(rules, context)
         
-        assert len(matched) == len(rules)
-        matched_names = {m.rule.name for m in matched}
-        assert matched_names == set(rule_names)
+        assert Counter(m.rule.name for m in matched) == Counter(rule_names)
 
     @given(
         pattern=st.sampled_from(["*.py", "*.js", "*.ts", "*.md"]),
@@ -151,9 +174,10 @@ class TestRuleMatcherPropertyTests:
             max_size=5,
         ),
     )
-    @settings(max_examples=100)
+    @_HYPOTHESIS_SETTINGS
     def test_file_match_pattern_correctness(
         self,
+        matcher: RuleMatcher,
         pattern: str,
         matching_files: list[str],
     ) -> None:
@@ -163,7 +187,6 @@ class TestRuleMatcherPropertyTests:
         For any rule with inclusion mode "fileMatch" and a glob pattern,
         the rule shall be included if and only if at least one file matches.
         """
-        matcher = RuleMatcher()
         rule = create_rule(
             inclusion=RuleInclusion.FILE_MATCH,
             file_match_pattern=pattern,
@@ -182,12 +205,13 @@ class TestRuleMatcherPropertyTests:
             assert len(matched) == 0
 
     @given(
-        rule_name=st.text(min_size=1, max_size=20).filter(lambda x: x.strip() != ""),
+        rule_name=_rule_names,
         referenced=st.booleans(),
     )
-    @settings(max_examples=100)
+    @_HYPOTHESIS_SETTINGS
     def test_manual_reference_inclusion(
         self,
+        matcher: RuleMatcher,
         rule_name: str,
         referenced: bool,
     ) -> None:
@@ -197,7 +221,6 @@ class TestRuleMatcherPropertyTests:
         For any rule with inclusion mode "manual", the rule shall be included
         if and only if its name appears in the manual_rules list.
         """
-        matcher = RuleMatcher()
         rule = create_rule(name=rule_name, inclusion=RuleInclusion.MANUAL)
         
         manual_rules = [rule_name] if referenced else []
@@ -215,55 +238,76 @@ class TestRuleMatcherPropertyTests:
 class TestFilePatternMatching:
     """Tests for file pattern matching."""
 
-    def test_match_extension(self) -> None:
-        """Test matching by file extension."""
-        matcher = RuleMatcher()
-        files = matcher._match_files("*.py", ["main.py", "test.js", "utils.py"])
-        assert set(files) == {"main.py", "utils.py"}
-
-    def test_match_full_path(self) -> None:
-        """Test matching full path patterns."""
-        matcher = RuleMatcher()
-        files = matcher._match_files("src/*.py", ["src/main.py", "test/main.py"])
-        assert files == ["src/main.py"]
-
-    def test_match_filename_only(self) -> None:
-        """Test that filename is also checked."""
-        matcher = RuleMatcher()
-        files = matcher._match_files("*.py", ["src/main.py"])
-        assert files == ["src/main.py"]
-
-    def test_match_recursive_pattern(self) -> None:
-        """Test recursive ** patterns."""
-        matcher = RuleMatcher()
-        files = matcher._match_files(
-            "src/**/*.py",
-            ["src/main.py", "src/utils/helper.py", "test/main.py"],
-        )
-        assert "src/main.py" in files or "src/utils/helper.py" in files
+    @pytest.mark.parametrize(
+        "pattern,files,expected",
+        [
+            # Match by file extension
+            ("*.py", ["main.py", "test.js", "utils.py"], ["main.py", "utils.py"]),
+            # Match full path patterns
+            ("src/*.py", ["src/main.py", "test/main.py"], ["src/main.py"]),
+            # Filename is also checked
+            ("*.py", ["src/main.py"], ["src/main.py"]),
+            # Recursive ** patterns
+            (
+                "src/**/*.py",
+                ["src/main.py", "src/utils/helper.py", "test/main.py"],
+                ["src/main.py", "src/utils/helper.py"],
+            ),
+        ],
+        ids=["extension", "full_path", "filename_only", "recursive"],
+    )
+    def test_match_files(
+        self,
+        matcher: RuleMatcher,
+        pattern: str,
+        files: list[str],
+        expected: list[str],
+    ) -> None:
+        """Test glob matching against full paths, filenames and ** patterns."""
+        assert matcher._match_files(pattern, files) == expected
+
+    def test_compiled_glob_is_cached(self) -> None:
+        """Test that repeated patterns reuse the compiled regex."""
+        assert _compile_glob("*.py") is _compile_glob("*.py")
+        assert _compile_glob("*.py").match("main.py")
+        assert not _compile_glob("*.py").match("main.js")
 
 
 class TestReferenceExtraction:
     """Tests for reference extraction."""
 
-    def test_extract_manual_references(self) -> None:
-        """Test extracting @rulename references."""
-        matcher = RuleMatcher()
-        text = "Please use @coding-standards and @security-review for this."
-        refs = matcher.extract_manual_references(text)
-        assert set(refs) == {"coding-standards", "security-review"}
-
-    def test_extract_file_references_backticks(self) -> None:
-        """Test extracting backtick-quoted file paths."""
-        matcher = RuleMatcher()
-        text = "Check `src/main.py` and `test/utils.ts` for examples."
-        files = matcher.extract_file_references(text)
-        assert "src/main.py" in files
-        assert "test/utils.ts" in files
-
-    def test_extract_file_references_prefix(self) -> None:
-        """Test extracting file: prefixed paths."""
-        matcher = RuleMatcher()
-        text = "See file:src/main.py for details."
-        files = matcher.extract_file_references(text)
-        assert "src/main.py" in files
+    @pytest.mark.parametrize(
+        "method,text,expected",
+        [
+            (
+                "extract_manual_references",
+                "Please use @coding-standards and @security-review for this.",
+                ["coding-standards", "security-review"],
+            ),
+            (
+                "extract_file_references",
+                "Check `src/main.py` and `test/utils.ts` for examples.",
+                ["src/main.py", "test/utils.ts"],
+            ),
+            (
+                "extract_file_references",
+                "See file:src/main.py for details.",
+                ["src/main.py"],
+            ),
+            (
+                "extract_file_references",
+                "See path:docs/guide.md for details.",
+                ["docs/guide.md"],
+            ),
+        ],
+        ids=["manual", "file_backticks", "file_prefix", "path_prefix"],
+    )
+    def test_extract_references(
+        self,
+        matcher: RuleMatcher,
+        method: str,
+        text: str,
+        expected: list[str],
+    ) -> None:
+        """Test extracting @rulename references and file paths from text."""
+        assert getattr(matcher, method)(text) == expected
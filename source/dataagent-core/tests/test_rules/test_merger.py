@@ -7,13 +7,22 @@
 **Validates: Requirements 2.4, 2.5, 4.1, 4.2, 4.3, 4.4, 4.5**
 """
 
+import functools
+
 import pytest
-from hypothesis import given, strategies as st, settings, assume
+from hypothesis import Phase, given, strategies as st, settings, assume
 
 from dataagent_core.rules.models import Rule, RuleScope, RuleInclusion, RuleMatch
 from dataagent_core.rules.merger import RuleMerger
 
 
+@pytest.fixture(scope="module")
+def merger() -> RuleMerger:
+    """Shared RuleMerger; the merger holds no per-call state."""
+    return RuleMerger()
+
+
+@functools.lru_cache(maxsize=256)
 def create_rule(
     name: str = "test",
     scope: RuleScope = RuleScope.USER,
@@ -21,7 +30,11 @@ def create_rule(
     override: bool = False,
     content: str = "Test content",
 ) -> Rule:
-    """Helper to create test rules."""
+    """Helper to create test rules.
+    
+    Cached by arguments, so identical calls share one Rule instance; tests
+    must not mutate the rules they get back.
+    """
     return Rule(
         name=name,
         description="Test rule",
@@ -37,12 +50,39 @@ def create_match(rule: Rule) -> RuleMatch:
     return RuleMatch(rule=rule, match_reason="test")
 
 
+# Static match sets; merge_rules never mutates its input, so these are
+# built once at import and shared by the basic tests.
+_SHARED_SCOPE_MATCHES = [
+    create_match(create_rule(name="shared", scope=scope))
+    for scope in (RuleScope.GLOBAL, RuleScope.USER, RuleScope.PROJECT)
+]
+
+_PRIORITY_MATCHES = [
+    create_match(create_rule(name="low", priority=30)),
+    create_match(create_rule(name="high", priority=80)),
+    create_match(create_rule(name="medium", priority=50)),
+]
+
+_OVERRIDE_MATCHES = [
+    create_match(create_rule(
+        name="shared",
+        scope=RuleScope.PROJECT,
+        content="Project content",
+    )),
+    create_match(create_rule(
+        name="shared",
+        scope=RuleScope.USER,
+        override=True,
+        content="User override content",
+    )),
+]
+
+
 class TestRuleMergerBasic:
     """Basic tests for RuleMerger."""
 
-    def test_merge_single_rule(self) -> None:
+    def test_merge_single_rule(self, merger: RuleMerger) -> None:
         """Test merging a single rule."""
-        merger = RuleMerger()
         rule = create_rule()
         matches = [create_match(rule)]
         
@@ -52,9 +92,8 @@ class TestRuleMergerBasic:
         assert final[0] == rule
         assert len(conflicts) == 0
 
-    def test_merge_multiple_rules(self) -> None:
+    def test_merge_multiple_rules(self, merger: RuleMerger) -> None:
         """Test merging multiple rules."""
-        merger = RuleMerger()
         rules = [
             create_rule(name="rule1"),
             create_rule(name="rule2"),
@@ -67,83 +106,93 @@ class TestRuleMergerBasic:
         assert len(final) == 3
         assert len(conflicts) == 0
 
-    def test_scope_priority_ordering(self) -> None:
+    def test_scope_priority_ordering(self, merger: RuleMerger) -> None:
         """Test that higher scope takes priority."""
-        merger = RuleMerger()
-        matches = [
-            create_match(create_rule(name="shared", scope=RuleScope.GLOBAL)),
-            create_match(create_rule(name="shared", scope=RuleScope.USER)),
-            create_match(create_rule(name="shared", scope=RuleScope.PROJECT)),
-        ]
-        
-        final, conflicts = merger.merge_rules(matches)
+        final, conflicts = merger.merge_rules(_SHARED_SCOPE_MATCHES)
         
         # Should keep PROJECT (highest priority)
         assert len(final) == 1
         assert final[0].scope == RuleScope.PROJECT
         assert len(conflicts) == 2
+        assert {reason for _, _, reason in conflicts} == {
+            "duplicate name, keeping project scope"
+        }
 
-    def test_rule_priority_ordering(self) -> None:
+    def test_rule_priority_ordering(self, merger: RuleMerger) -> None:
         """Test that higher priority rules come first."""
-        merger = RuleMerger()
-        matches = [
-            create_match(create_rule(name="low", priority=30)),
-            create_match(create_rule(name="high", priority=80)),
-            create_match(create_rule(name="medium", priority=50)),
-        ]
-        
-        final, conflicts = merger.merge_rules(matches)
+        final, conflicts = merger.merge_rules(_PRIORITY_MATCHES)
         
         # Should be sorted by priority (descending)
         assert final[0].name == "high"
         assert final[1].name == "medium"
         assert final[2].name == "low"
 
-    def test_override_behavior(self) -> None:
+    def test_override_behavior(self, merger: RuleMerger) -> None:
         """Test that override replaces existing rule."""
-        merger = RuleMerger()
-        matches = [
-            create_match(create_rule(
-                name="shared",
-                scope=RuleScope.PROJECT,
-                content="Project content",
-            )),
-            create_match(create_rule(
-                name="shared",
-                scope=RuleScope.USER,
-                override=True,
-                content="User override content",
-            )),
-        ]
-        
-        final, conflicts = merger.merge_rules(matches)
+        final, conflicts = merger.merge_rules(_OVERRIDE_MATCHES)
         
         # User rule with override should replace project rule
         assert len(final) == 1
         assert final[0].content == "User override content"
+        assert conflicts == [("shared", "shared", "overridden by user scope")]
+
+
+# Same-scope matches with arbitrary names and priorities
+_priority_match_strategy = st.builds(
+    lambda index, priority: create_match(
+        create_rule(name=f"rule{index}", priority=priority)
+    ),
+    st.integers(min_value=0, max_value=100),
+    st.integers(min_value=1, max_value=100),
+)
+
+# Higher scope rule (would normally win)
+_base_rule_strategy = st.builds(
+    create_rule,
+    name=st.just("shared"),
+    scope=st.just(RuleScope.PROJECT),
+    priority=st.integers(min_value=1, max_value=50),
+    content=st.just("Base content"),
+)
+
+# Lower scope rule with override
+_override_rule_strategy = st.builds(
+    create_rule,
+    name=st.just("shared"),
+    scope=st.just(RuleScope.USER),
+    priority=st.integers(min_value=1, max_value=50),
+    override=st.just(True),
+    content=st.just("Override content"),
+)
 
 
 class TestRuleMergerPropertyTests:
     """Property-based tests for RuleMerger."""
 
     @given(
-        scopes=st.lists(
+        scopes=st.sets(
             st.sampled_from([RuleScope.GLOBAL, RuleScope.USER, RuleScope.PROJECT]),
             min_size=2,
             max_size=3,
-            unique=True,
-        )
+        ).map(list)
     )
-    @settings(max_examples=100)
-    def test_scope_priority_ordering_property(self, scopes: list[RuleScope]) -> None:
+    # Only four scope sets exist, so a few dozen examples cover every
+    # combination and there is nothing worth shrinking.
+    @settings(
+        max_examples=30,
+        phases=(Phase.explicit, Phase.reuse, Phase.generate),
+    )
+    def test_scope_priority_ordering_property(
+        self,
+        merger: RuleMerger,
+        scopes: list[RuleScope],
+    ) -> None:
         """
         **Feature: agent-rules, Property 4: Scope Priority Ordering**
         
         For any set of rules with the same name at different scopes,
         merging shall always select the rule from the highest-priority scope.
         """
-        merger = RuleMerger()
-        
         # Create rules with same name at different scopes
         matches = [
             create_match(create_rule(name="shared", scope=scope))
@@ -156,19 +205,23 @@ class TestRuleMergerPropertyTests:
         assert len(final) == 1
         
         # Should be the highest priority scope
-        expected_scope = max(scopes, key=lambda s: merger.SCOPE_PRIORITY[s])
+        expected_scope = max(scopes, key=RuleMerger.SCOPE_PRIORITY.__getitem__)
         assert final[0].scope == expected_scope
 
     @given(
-        priorities=st.lists(
-            st.integers(min_value=1, max_value=100),
+        matches=st.lists(
+            _priority_match_strategy,
             min_size=2,
             max_size=10,
-            unique=True,
+            unique_by=lambda m: m.rule.name,
         )
     )
     @settings(max_examples=100)
-    def test_priority_ordering_consistency(self, priorities: list[int]) -> None:
+    def test_priority_ordering_consistency(
+        self,
+        merger: RuleMerger,
+        matches: list[RuleMatch],
+    ) -> None:
         """
         **Feature: agent-rules, Property 8: Priority Ordering Consistency**
         
@@ -176,32 +229,22 @@ class TestRuleMergerPropertyTests:
         by scope priority (descending), then rule priority (descending),
         then alphabetically by name.
         """
-        merger = RuleMerger()
-        
-        # Create rules with different priorities
-        matches = [
-            create_match(create_rule(name=f"rule{i}", priority=p))
-            for i, p in enumerate(priorities)
-        ]
-        
         final, _ = merger.merge_rules(matches)
         
-        # Verify ordering: higher priority should come first
-        for i in range(len(final) - 1):
-            # Same scope, so compare by priority
-            assert final[i].priority >= final[i + 1].priority or \
-                   (final[i].priority == final[i + 1].priority and 
-                    final[i].name <= final[i + 1].name)
+        # Names are unique, so nothing is dropped
+        assert len(final) == len(matches)
+        
+        # Verify ordering: same scope, so priority descending, then name
+        expected_order = sorted(final, key=lambda r: (-r.priority, r.name))
+        assert [r.name for r in final] == [r.name for r in expected_order]
 
-    @given(
-        base_priority=st.integers(min_value=1, max_value=50),
-        override_priority=st.integers(min_value=1, max_value=50),
-    )
+    @given(base_rule=_base_rule_strategy, override_rule=_override_rule_strategy)
     @settings(max_examples=100)
     def test_override_behavior_property(
         self,
-        base_priority: int,
-        override_priority: int,
+        merger: RuleMerger,
+        base_rule: Rule,
+        override_rule: Rule,
     ) -> None:
         """
         **Feature: agent-rules, Property 9: Override Behavior**
@@ -209,25 +252,6 @@ class TestRuleMergerPropertyTests:
         For any rule with override=true, if a lower-priority rule with the
         same name exists, the override rule shall replace it in the final list.
         """
-        merger = RuleMerger()
-        
-        # Higher scope rule (would normally win)
-        base_rule = create_rule(
-            name="shared",
-            scope=RuleScope.PROJECT,
-            priority=base_priority,
-            content="Base content",
-        )
-        
-        # Lower scope rule with override
-        override_rule = create_rule(
-            name="shared",
-            scope=RuleScope.USER,
-            priority=override_priority,
-            override=True,
-            content="Override content",
-        )
-        
         matches = [create_match(base_rule), create_match(override_rule)]
         final, conflicts = merger.merge_rules(matches)
         
@@ -238,8 +262,10 @@ class TestRuleMergerPropertyTests:
 
     @given(
         num_rules=st.integers(min_value=5, max_value=20),
-        content_size=st.integers(min_value=1000, max_value=5000),
-        max_size=st.integers(min_value=5000, max_value=20000),
+        content_size=st.sampled_from([1000, 2500, 5000]),
+        # 3000 and 7500 are not multiples of every content size, so the
+        # first rule that does not fit leaves part of the budget unused
+        max_size=st.sampled_from([3000, 5000, 7500, 10000]),
     )
     @settings(max_examples=50)
     def test_size_limit_truncation(
@@ -255,6 +281,9 @@ class TestRuleMergerPropertyTests:
         the merger shall truncate lower-priority rules first while keeping
         higher-priority rules intact.
         """
+        # Only inputs that overflow the limit exercise truncation
+        assume(num_rules * content_size > max_size)
+        
         merger = RuleMerger(max_content_size=max_size)
         
         # Create rules with varying priorities
@@ -269,58 +298,62 @@ class TestRuleMergerPropertyTests:
         
         final, _ = merger.merge_rules(matches)
         
-        # Total size should not exceed limit
-        total_size = sum(len(r.content) for r in final)
-        assert total_size <= max_size
+        # Every rule has the same content size, so the total is a product
+        # and exactly as many rules fit as the limit allows
+        assert len(final) * content_size <= max_size
+        assert len(final) == min(num_rules, max_size // content_size)
         
-        # Higher priority rules should be kept
-        if len(final) > 0:
-            # First rule should have highest priority
+        # A single rule larger than the limit leaves nothing to keep;
+        # otherwise the highest priority rule comes first
+        if content_size > max_size:
+            assert final == []
+        else:
             assert final[0].priority == 100
 
 
 class TestPromptGeneration:
     """Tests for prompt section generation."""
 
-    def test_build_prompt_section_empty(self) -> None:
+    def test_build_prompt_section_empty(self, merger: RuleMerger) -> None:
         """Test building prompt with no rules."""
-        merger = RuleMerger()
         result = merger.build_prompt_section([])
         assert result == ""
 
-    def test_build_prompt_section_single(self) -> None:
-        """Test building prompt with single rule."""
-        merger = RuleMerger()
-        rule = create_rule(name="test-rule", content="# Test\n\nContent here.")
-        
-        result = merger.build_prompt_section([rule])
-        
-        assert "## Agent Rules" in result
-        assert "### test-rule" in result
-        assert "Content here." in result
-
-    def test_build_prompt_section_multiple(self) -> None:
-        """Test building prompt with multiple rules."""
-        merger = RuleMerger()
-        rules = [
-            create_rule(name="rule1", content="Content 1"),
-            create_rule(name="rule2", content="Content 2"),
-        ]
-        
+    @pytest.mark.parametrize(
+        "rules,expected_substrings",
+        [
+            (
+                [create_rule(name="test-rule", content="# Test\n\nContent here.")],
+                ["## Agent Rules", "### test-rule", "Content here."],
+            ),
+            (
+                [
+                    create_rule(name="rule1", content="Content 1"),
+                    create_rule(name="rule2", content="Content 2"),
+                ],
+                ["### rule1", "### rule2", "Content 1", "Content 2"],
+            ),
+        ],
+        ids=["single", "multiple"],
+    )
+    def test_build_prompt_section(
+        self,
+        merger: RuleMerger,
+        rules: list[Rule],
+        expected_substrings: list[str],
+    ) -> None:
+        """Test building prompt sections with one or more rules."""
         result = merger.build_prompt_section(rules)
         
-        assert "### rule1" in result
-        assert "### rule2" in result
-        assert "Content 1" in result
-        assert "Content 2" in result
+        for expected in expected_substrings:
+            assert expected in result
 
 
 class TestConflictDetection:
     """Tests for conflict detection."""
 
-    def test_detect_no_conflicts(self) -> None:
+    def test_detect_no_conflicts(self, merger: RuleMerger) -> None:
         """Test detection with no conflicts."""
-        merger = RuleMerger()
         rules = [
             create_rule(name="rule1"),
             create_rule(name="rule2"),
@@ -329,9 +362,8 @@ class TestConflictDetection:
         conflicts = merger.detect_conflicts(rules)
         assert len(conflicts) == 0
 
-    def test_detect_name_conflict(self) -> None:
+    def test_detect_name_conflict(self, merger: RuleMerger) -> None:
         """Test detection of name conflicts."""
-        merger = RuleMerger()
         rules = [
             create_rule(name="shared", scope=RuleScope.GLOBAL),
             create_rule(name="shared", scope=RuleScope.USER),
@@ -342,5 +374,4 @@ class TestConflictDetection:
         
         assert len(conflicts) == 1
         assert conflicts[0]["name"] == "shared"
-        assert "global" in conflicts[0]["scopes"]
-        assert "user" in conflicts[0]["scopes"]
+        assert set(conflicts[0]["scopes"]) == {"global", "user"}
@@ -5,6 +5,8 @@
 **Validates: Requirements 7.1, 7.2, 7.3, 7.4, 13.1, 13.2**
 """
 
+import copy
+
 import pytest
 from unittest.mock import MagicMock, AsyncMock
 from datetime import datetime
@@ -33,11 +35,9 @@ class MockModelRequest:
         self.state = state or {}
     
     def override(self, system_prompt: str) -> "MockModelRequest":
-        return MockModelRequest(
-            messages=self.messages,
-            system_prompt=system_prompt,
-            state=self.state,
-        )
+        new = copy.copy(self)
+        new.system_prompt = system_prompt
+        return new
 
 
 class MockModelResponse:
@@ -46,23 +46,33 @@ class MockModelResponse:
         self.content = content
 
 
+@pytest.fixture
+def store() -> MemoryRuleStore:
+    """Fresh in-memory rule store for each test."""
+    return MemoryRuleStore()
+
+
+@pytest.fixture
+def middleware(store: MemoryRuleStore) -> RulesMiddleware:
+    """RulesMiddleware with default settings over the ``store`` fixture."""
+    return RulesMiddleware(store)
+
+
 class TestRulesMiddlewareBasic:
     """Basic tests for RulesMiddleware."""
 
-    def test_middleware_creation(self) -> None:
+    def test_middleware_creation(
+        self,
+        store: MemoryRuleStore,
+        middleware: RulesMiddleware,
+    ) -> None:
         """Test creating a RulesMiddleware instance."""
-        store = MemoryRuleStore()
-        middleware = RulesMiddleware(store)
-        
         assert middleware.store is store
         assert middleware.debug_mode is False
         assert middleware._last_trace is None
 
-    def test_before_agent_reloads_rules(self) -> None:
+    def test_before_agent_reloads_rules(self, middleware: RulesMiddleware) -> None:
         """Test that before_agent reloads rules."""
-        store = MemoryRuleStore()
-        middleware = RulesMiddleware(store)
-        
         state: RulesState = {}
         runtime = MagicMock()
         
@@ -72,9 +82,12 @@ class TestRulesMiddlewareBasic:
         assert result["rules_loaded"] is True
         assert result["triggered_rules"] == []
 
-    def test_inject_always_rule(self) -> None:
+    def test_inject_always_rule(
+        self,
+        store: MemoryRuleStore,
+        middleware: RulesMiddleware,
+    ) -> None:
         """Test that always rules are injected into system prompt."""
-        store = MemoryRuleStore()
         rule = Rule(
             name="always-rule",
             description="Always included",
@@ -84,8 +97,6 @@ class TestRulesMiddlewareBasic:
         )
         store.save_rule(rule)
         
-        middleware = RulesMiddleware(store)
-        
         request = MockModelRequest(
             messages=[MockMessage("Hello")],
             system_prompt="Base prompt",
@@ -99,9 +110,71 @@ class TestRulesMiddlewareBasic:
         assert "Always follow this rule." in call_args.system_prompt
         assert "Base prompt" in call_args.system_prompt
 
-    def test_inject_manual_rule_when_referenced(self) -> None:
+    def test_empty_store_skips_context_scan(
+        self,
+        store: MemoryRuleStore,
+        middleware: RulesMiddleware,
+    ) -> None:
+        """Test that an empty store passes the request through unscanned."""
+        middleware._build_match_context = MagicMock()
+        
+        request = MockModelRequest(
+            messages=[MockMessage("Check `src/main.py` with @security-check")],
+            system_prompt="Base prompt",
+        )
+        
+        handler = MagicMock(return_value=MockModelResponse())
+        middleware.wrap_model_call(request, handler)
+        
+        middleware._build_match_context.assert_not_called()
+        assert handler.call_args[0][0] is request
+        trace = middleware.get_last_trace()
+        assert trace is not None
+        assert trace.evaluated_rules == []
+
+    def test_always_rules_come_first_in_prompt(
+        self,
+        store: MemoryRuleStore,
+        middleware: RulesMiddleware,
+    ) -> None:
+        """Test that always rules precede conditional rules in the prompt."""
+        store.save_rule(Rule(
+            name="manual-rule",
+            description="Manual",
+            content="Manual content.",
+            scope=RuleScope.PROJECT,
+            inclusion=RuleInclusion.MANUAL,
+            priority=90,
+        ))
+        store.save_rule(Rule(
+            name="always-rule",
+            description="Always",
+            content="Always content.",
+            scope=RuleScope.USER,
+            inclusion=RuleInclusion.ALWAYS,
+            priority=10,
+        ))
+        
+        request = MockModelRequest(
+            messages=[MockMessage("Apply @manual-rule")],
+            system_prompt="Base prompt",
+        )
+        
+        handler = MagicMock(return_value=MockModelResponse())
+        middleware.wrap_model_call(request, handler)
+        
+        prompt = handler.call_args[0][0].system_prompt
+        assert prompt.startswith("Base prompt")
+        assert prompt.index("Always content.") < prompt.index("Manual content.")
+        # The trace keeps merger order (scope, then priority)
+        assert middleware.get_triggered_rules() == ["manual-rule", "always-rule"]
+
+    def test_inject_manual_rule_when_referenced(
+        self,
+        store: MemoryRuleStore,
+        middleware: RulesMiddleware,
+    ) -> None:
         """Test that manual rules are injected when referenced."""
-        store = MemoryRuleStore()
         rule = Rule(
             name="security-check",
             description="Security checklist",
@@ -111,8 +184,6 @@ class TestRulesMiddlewareBasic:
         )
         store.save_rule(rule)
         
-        middleware = RulesMiddleware(store)
-        
         # Reference the rule with @security-check
         request = MockModelRequest(
             messages=[MockMessage("Please review @security-check")],
@@ -125,9 +196,12 @@ class TestRulesMiddlewareBasic:
         call_args = handler.call_args[0][0]
         assert "Check for vulnerabilities." in call_args.system_prompt
 
-    def test_skip_manual_rule_when_not_referenced(self) -> None:
+    def test_skip_manual_rule_when_not_referenced(
+        self,
+        store: MemoryRuleStore,
+        middleware: RulesMiddleware,
+    ) -> None:
         """Test that manual rules are skipped when not referenced."""
-        store = MemoryRuleStore()
         rule = Rule(
             name="security-check",
             description="Security checklist",
@@ -137,8 +211,6 @@ class TestRulesMiddlewareBasic:
         )
         store.save_rule(rule)
         
-        middleware = RulesMiddleware(store)
-        
         request = MockModelRequest(
             messages=[MockMessage("Hello world")],
             system_prompt="Base prompt",
@@ -150,9 +222,12 @@ class TestRulesMiddlewareBasic:
         call_args = handler.call_args[0][0]
         assert "Check for vulnerabilities." not in call_args.system_prompt
 
-    def test_inject_file_match_rule(self) -> None:
+    def test_inject_file_match_rule(
+        self,
+        store: MemoryRuleStore,
+        middleware: RulesMiddleware,
+    ) -> None:
         """Test that fileMatch rules are injected when files match."""
-        store = MemoryRuleStore()
         rule = Rule(
             name="python-rules",
             description="Python coding rules",
@@ -163,8 +238,6 @@ class TestRulesMiddlewareBasic:
         )
         store.save_rule(rule)
         
-        middleware = RulesMiddleware(store)
-        
         # Reference a Python file
         request = MockModelRequest(
             messages=[MockMessage("Please check `main.py`")],
@@ -181,10 +254,12 @@ class TestRulesMiddlewareBasic:
 class TestRulesMiddlewareAsync:
     """Async tests for RulesMiddleware."""
 
-    @pytest.mark.asyncio
-    async def test_async_wrap_model_call(self) -> None:
+    async def test_async_wrap_model_call(
+        self,
+        store: MemoryRuleStore,
+        middleware: RulesMiddleware,
+    ) -> None:
         """Test async model call wrapping."""
-        store = MemoryRuleStore()
         rule = Rule(
             name="async-rule",
             description="Async test rule",
@@ -194,8 +269,6 @@ class TestRulesMiddlewareAsync:
         )
         store.save_rule(rule)
         
-        middleware = RulesMiddleware(store)
-        
         request = MockModelRequest(
             messages=[MockMessage("Hello")],
             system_prompt="Base",
@@ -214,9 +287,12 @@ class TestTraceRecording:
     **Property 13: Trace Recording Completeness**
     """
 
-    def test_trace_records_evaluated_rules(self) -> None:
+    def test_trace_records_evaluated_rules(
+        self,
+        store: MemoryRuleStore,
+        middleware: RulesMiddleware,
+    ) -> None:
         """Test that trace records all evaluated rules."""
-        store = MemoryRuleStore()
         rule1 = Rule(
             name="rule1",
             description="Rule 1",
@@ -234,8 +310,6 @@ class TestTraceRecording:
         store.save_rule(rule1)
         store.save_rule(rule2)
         
-        middleware = RulesMiddleware(store)
-        
         request = MockModelRequest(messages=[MockMessage("Hello")])
         handler = MagicMock(return_value=MockModelResponse())
         middleware.wrap_model_call(request, handler)
@@ -245,9 +319,12 @@ class TestTraceRecording:
         assert "rule1" in trace.evaluated_rules
         assert "rule2" in trace.evaluated_rules
 
-    def test_trace_records_matched_rules(self) -> None:
+    def test_trace_records_matched_rules(
+        self,
+        store: MemoryRuleStore,
+        middleware: RulesMiddleware,
+    ) -> None:
         """Test that trace records matched rules with reasons."""
-        store = MemoryRuleStore()
         rule = Rule(
             name="always-rule",
             description="Always rule",
@@ -257,8 +334,6 @@ class TestTraceRecording:
         )
         store.save_rule(rule)
         
-        middleware = RulesMiddleware(store)
-        
         request = MockModelRequest(messages=[MockMessage("Hello")])
         handler = MagicMock(return_value=MockModelResponse())
         middleware.wrap_model_call(request, handler)
@@ -269,9 +344,12 @@ class TestTraceRecording:
         assert trace.matched_rules[0].rule.name == "always-rule"
         assert "always" in trace.matched_rules[0].match_reason.lower()
 
-    def test_trace_records_skipped_rules(self) -> None:
+    def test_trace_records_skipped_rules(
+        self,
+        store: MemoryRuleStore,
+        middleware: RulesMiddleware,
+    ) -> None:
         """Test that trace records skipped rules with reasons."""
-        store = MemoryRuleStore()
         rule = Rule(
             name="manual-rule",
             description="Manual rule",
@@ -281,8 +359,6 @@ class TestTraceRecording:
         )
         store.save_rule(rule)
         
-        middleware = RulesMiddleware(store)
-        
         request = MockModelRequest(messages=[MockMessage("Hello")])
         handler = MagicMock(return_value=MockModelResponse())
         middleware.wrap_model_call(request, handler)
@@ -292,9 +368,12 @@ class TestTraceRecording:
         assert len(trace.skipped_rules) == 1
         assert trace.skipped_rules[0][0] == "manual-rule"
 
-    def test_trace_records_final_rules(self) -> None:
+    def test_trace_records_final_rules(
+        self,
+        store: MemoryRuleStore,
+        middleware: RulesMiddleware,
+    ) -> None:
         """Test that trace records final applied rules."""
-        store = MemoryRuleStore()
         rule = Rule(
             name="final-rule",
             description="Final rule",
@@ -304,8 +383,6 @@ class TestTraceRecording:
         )
         store.save_rule(rule)
         
-        middleware = RulesMiddleware(store)
-        
         request = MockModelRequest(messages=[MockMessage("Hello")])
         handler = MagicMock(return_value=MockModelResponse())
         middleware.wrap_model_call(request, handler)
@@ -314,9 +391,12 @@ class TestTraceRecording:
         assert trace is not None
         assert "final-rule" in trace.final_rules
 
-    def test_trace_records_content_size(self) -> None:
+    def test_trace_records_content_size(
+        self,
+        store: MemoryRuleStore,
+        middleware: RulesMiddleware,
+    ) -> None:
         """Test that trace records total content size."""
-        store = MemoryRuleStore()
         content = "X" * 100
         rule = Rule(
             name="sized-rule",
@@ -327,8 +407,6 @@ class TestTraceRecording:
         )
         store.save_rule(rule)
         
-        middleware = RulesMiddleware(store)
-        
         request = MockModelRequest(messages=[MockMessage("Hello")])
         handler = MagicMock(return_value=MockModelResponse())
         middleware.wrap_model_call(request, handler)
@@ -337,13 +415,49 @@ class TestTraceRecording:
         assert trace is not None
         assert trace.total_content_size == 100
 
+    def test_trace_disabled_skips_recording(self, store: MemoryRuleStore) -> None:
+        """Test that disabling traces leaves no trace but still injects rules."""
+        store.save_rule(Rule(
+            name="always-rule",
+            description="Always",
+            content="Always content.",
+            scope=RuleScope.USER,
+        ))
+        
+        middleware = RulesMiddleware(store, trace_enabled=False)
+        
+        request = MockModelRequest(messages=[MockMessage("Hello")])
+        handler = MagicMock(return_value=MockModelResponse())
+        middleware.wrap_model_call(request, handler)
+        
+        assert "Always content." in handler.call_args[0][0].system_prompt
+        assert middleware.get_last_trace() is None
+        assert middleware.get_triggered_rules() == []
+
+    def test_trace_disabled_still_records_for_debug_mode(
+        self,
+        store: MemoryRuleStore,
+    ) -> None:
+        """Test that debug mode keeps tracing on when traces are disabled."""
+        middleware = RulesMiddleware(store, trace_enabled=False)
+        middleware.set_debug_mode(True)
+        
+        handler = MagicMock(return_value=MockModelResponse())
+        middleware.wrap_model_call(MockModelRequest(), handler)
+        
+        assert middleware.get_last_trace() is not None
+        
+        middleware.set_debug_mode(False)
+        middleware.wrap_model_call(MockModelRequest(), handler)
+        
+        assert middleware.get_last_trace() is None
+
 
 class TestDebugMode:
     """Tests for debug mode functionality."""
 
-    def test_debug_mode_adds_trace_to_prompt(self) -> None:
+    def test_debug_mode_adds_trace_to_prompt(self, store: MemoryRuleStore) -> None:
         """Test that debug mode adds trace info to system prompt."""
-        store = MemoryRuleStore()
         rule = Rule(
             name="debug-rule",
             description="Debug rule",
@@ -363,11 +477,8 @@ class TestDebugMode:
         assert "[DEBUG] Rule Evaluation Trace" in call_args.system_prompt
         assert "debug-rule" in call_args.system_prompt
 
-    def test_set_debug_mode(self) -> None:
+    def test_set_debug_mode(self, middleware: RulesMiddleware) -> None:
         """Test setting debug mode dynamically."""
-        store = MemoryRuleStore()
-        middleware = RulesMiddleware(store)
-        
         assert middleware.debug_mode is False
         
         middleware.set_debug_mode(True)
@@ -380,44 +491,54 @@ class TestDebugMode:
 class TestFileReferenceExtraction:
     """Tests for file reference extraction."""
 
-    def test_extract_backtick_references(self) -> None:
+    def test_extract_backtick_references(self, middleware: RulesMiddleware) -> None:
         """Test extracting file references from backticks."""
-        store = MemoryRuleStore()
-        middleware = RulesMiddleware(store)
-        
         content = "Check `src/main.py` and `tests/test_main.py`"
         files = middleware._extract_file_references(content)
         
         assert "src/main.py" in files
         assert "tests/test_main.py" in files
 
-    def test_extract_file_prefix_references(self) -> None:
+    def test_extract_file_prefix_references(
+        self,
+        middleware: RulesMiddleware,
+    ) -> None:
         """Test extracting file: prefix references."""
-        store = MemoryRuleStore()
-        middleware = RulesMiddleware(store)
-        
         content = "See file:config.yaml for details"
         files = middleware._extract_file_references(content)
         
         assert "config.yaml" in files
 
-    def test_extract_path_prefix_references(self) -> None:
+    def test_extract_path_prefix_references(
+        self,
+        middleware: RulesMiddleware,
+    ) -> None:
         """Test extracting path: prefix references."""
-        store = MemoryRuleStore()
-        middleware = RulesMiddleware(store)
-        
         content = "Located at path:/etc/config.json"
         files = middleware._extract_file_references(content)
         
         assert "/etc/config.json" in files
 
+    def test_extract_mixed_references_in_order(
+        self,
+        middleware: RulesMiddleware,
+    ) -> None:
+        """Test that mixed reference kinds are returned in text order."""
+        content = "Edit path:docs/a.md then `src/b.py` and file:c.yaml"
+        files = middleware._extract_file_references(content)
+        
+        assert files == ["docs/a.md", "src/b.py", "c.yaml"]
+
 
 class TestGetTriggeredRules:
     """Tests for get_triggered_rules method."""
 
-    def test_get_triggered_rules_returns_final_rules(self) -> None:
+    def test_get_triggered_rules_returns_final_rules(
+        self,
+        store: MemoryRuleStore,
+        middleware: RulesMiddleware,
+    ) -> None:
         """Test that get_triggered_rules returns final rule names."""
-        store = MemoryRuleStore()
         rule = Rule(
             name="triggered-rule",
             description="Triggered",
@@ -427,8 +548,6 @@ class TestGetTriggeredRules:
         )
         store.save_rule(rule)
         
-        middleware = RulesMiddleware(store)
-        
         request = MockModelRequest(messages=[MockMessage("Hello")])
         handler = MagicMock(return_value=MockModelResponse())
         middleware.wrap_model_call(request, handler)
@@ -436,11 +555,11 @@ class TestGetTriggeredRules:
         triggered = middleware.get_triggered_rules()
         assert "triggered-rule" in triggered
 
-    def test_get_triggered_rules_empty_before_call(self) -> None:
+    def test_get_triggered_rules_empty_before_call(
+        self,
+        middleware: RulesMiddleware,
+    ) -> None:
         """Test that get_triggered_rules returns empty list before any call."""
-        store = MemoryRuleStore()
-        middleware = RulesMiddleware(store)
-        
         triggered = middleware.get_triggered_rules()
         assert triggered == []
 
@@ -449,9 +568,8 @@ class TestGetTriggeredRules:
 class TestEventEmission:
     """Tests for event emission functionality."""
 
-    def test_emits_rules_applied_event(self) -> None:
+    def test_emits_rules_applied_event(self, store: MemoryRuleStore) -> None:
         """Test that RulesAppliedEvent is emitted."""
-        store = MemoryRuleStore()
         rule = Rule(
             name="event-rule",
             description="Event test rule",
@@ -475,9 +593,8 @@ class TestEventEmission:
         assert len(applied_events[0].triggered_rules) == 1
         assert applied_events[0].triggered_rules[0]["name"] == "event-rule"
 
-    def test_emits_debug_event_when_debug_mode(self) -> None:
+    def test_emits_debug_event_when_debug_mode(self, store: MemoryRuleStore) -> None:
         """Test that RuleDebugEvent is emitted in debug mode."""
-        store = MemoryRuleStore()
         rule = Rule(
             name="debug-event-rule",
             description="Debug event test",
@@ -504,9 +621,12 @@ class TestEventEmission:
         assert len(debug_events) == 1
         assert "debug-event-rule" in debug_events[0].final_rules
 
-    def test_no_events_without_callback(self) -> None:
+    def test_no_events_without_callback(
+        self,
+        store: MemoryRuleStore,
+        middleware: RulesMiddleware,
+    ) -> None:
         """Test that no events are emitted without callback."""
-        store = MemoryRuleStore()
         rule = Rule(
             name="no-callback-rule",
             description="No callback test",
@@ -516,18 +636,14 @@ class TestEventEmission:
         )
         store.save_rule(rule)
         
-        # No event_callback provided
-        middleware = RulesMiddleware(store)
-        
         request = MockModelRequest(messages=[MockMessage("Hello")])
         handler = MagicMock(return_value=MockModelResponse())
         
         # Should not raise any errors
         middleware.wrap_model_call(request, handler)
 
-    def test_event_contains_conflict_info(self) -> None:
+    def test_event_contains_conflict_info(self, store: MemoryRuleStore) -> None:
         """Test that events contain conflict information."""
-        store = MemoryRuleStore()
         # Create two rules with same name at different scopes
         rule1 = Rule(
             name="conflict-rule",
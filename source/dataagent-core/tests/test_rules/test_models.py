@@ -18,6 +18,9 @@ from dataagent_core.rules.models import (
 )
 
 
+# Deterministic examples and no per-example deadline for the property tests.
+_HYPOTHESIS_SETTINGS = settings(max_examples=50, deadline=None, derandomize=True)
+
 # Strategies for generating test data
 rule_name_strategy = st.text(
     alphabet=st.characters(whitelist_categories=("L", "N"), whitelist_characters="_-"),
@@ -121,7 +124,7 @@ class TestRuleModel:
             )
 
     @given(rule=rule_strategy())
-    @settings(max_examples=100)
+    @_HYPOTHESIS_SETTINGS
     def test_rule_serialization_round_trip(self, rule: Rule) -> None:
         """
         **Feature: agent-rules, Property 1: Rule Parsing Round Trip**
@@ -149,7 +152,7 @@ class TestRuleModel:
         assert restored_rule.metadata == rule.metadata
 
     @given(rule=rule_strategy())
-    @settings(max_examples=100)
+    @_HYPOTHESIS_SETTINGS
     def test_rule_to_dict_completeness(self, rule: Rule) -> None:
         """
         **Feature: agent-rules, Property 12: Rule Serialization Completeness**
@@ -212,6 +215,40 @@ class TestRuleModel:
         rule_set = {rule1, rule2}
         assert len(rule_set) == 1
 
+    def test_rule_name_interned(self) -> None:
+        """Test that equal rule names share one string object."""
+        # Build the names at runtime so they are not shared code constants
+        parts = ("interned", "rule")
+        rule1 = Rule(
+            name="-".join(parts),
+            description="Test",
+            content="Content",
+            scope=RuleScope.USER,
+        )
+        rule2 = Rule(
+            name="-".join(parts),
+            description="Test",
+            content="Content",
+            scope=RuleScope.PROJECT,
+        )
+        
+        assert rule1.name is rule2.name
+
+    def test_rule_name_str_subclass_accepted(self) -> None:
+        """Test that names which are not exact str are kept, not interned."""
+        class RuleName(str):
+            pass
+        
+        name = RuleName("subclass-rule")
+        rule = Rule(
+            name=name,
+            description="Test",
+            content="Content",
+            scope=RuleScope.USER,
+        )
+        
+        assert rule.name is name
+
 
 class TestRuleMatch:
     """Tests for RuleMatch model."""
@@ -5,8 +5,8 @@ Tests for FileRuleStore and MemoryRuleStore.
 """
 
 import pytest
-import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 from dataagent_core.rules.models import Rule, RuleScope, RuleInclusion
 from dataagent_core.rules.store import FileRuleStore, MemoryRuleStore
@@ -115,162 +115,202 @@ class TestMemoryRuleStore:
 class TestFileRuleStore:
     """Tests for FileRuleStore."""
 
-    def test_save_and_load_rule(self) -> None:
+    def test_save_and_load_rule(self, tmp_path: Path) -> None:
         """Test saving a rule to file and loading it back."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            user_dir = Path(tmpdir) / "user"
-            store = FileRuleStore(user_dir=user_dir)
-            
-            rule = create_test_rule()
-            store.save_rule(rule)
-            
-            # Verify file was created
-            file_path = user_dir / "test-rule.md"
-            assert file_path.exists()
-            
-            # Reload and verify
-            store.reload()
-            retrieved = store.get_rule("test-rule", RuleScope.USER)
-            
-            assert retrieved is not None
-            assert retrieved.name == "test-rule"
-            assert retrieved.description == "Test rule description"
+        user_dir = tmp_path / "user"
+        store = FileRuleStore(user_dir=user_dir)
+        
+        rule = create_test_rule()
+        store.save_rule(rule)
+        
+        # Verify file was created
+        file_path = user_dir / "test-rule.md"
+        assert file_path.exists()
+        
+        # Reload and verify
+        store.reload()
+        retrieved = store.get_rule("test-rule", RuleScope.USER)
+        
+        assert retrieved is not None
+        assert retrieved.name == "test-rule"
+        assert retrieved.description == "Test rule description"
 
-    def test_directory_creation(self) -> None:
+    def test_directory_creation(self, tmp_path: Path) -> None:
         """Test that directories are created automatically."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            user_dir = Path(tmpdir) / "nested" / "user" / "rules"
-            store = FileRuleStore(user_dir=user_dir)
-            
-            rule = create_test_rule()
-            store.save_rule(rule)
-            
-            assert user_dir.exists()
-            assert (user_dir / "test-rule.md").exists()
+        user_dir = tmp_path / "nested" / "user" / "rules"
+        store = FileRuleStore(user_dir=user_dir)
+        
+        rule = create_test_rule()
+        store.save_rule(rule)
+        
+        assert user_dir.exists()
+        assert (user_dir / "test-rule.md").exists()
 
-    def test_load_multiple_scopes(self) -> None:
+    def test_load_multiple_scopes(self, tmp_path: Path) -> None:
         """Test loading rules from multiple scope directories."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            global_dir = Path(tmpdir) / "global"
-            user_dir = Path(tmpdir) / "user"
-            project_dir = Path(tmpdir) / "project"
-            
-            store = FileRuleStore(
-                global_dir=global_dir,
-                user_dir=user_dir,
-                project_dir=project_dir,
-            )
-            
-            # Save rules to different scopes
-            store.save_rule(create_test_rule("global-rule", RuleScope.GLOBAL))
-            store.save_rule(create_test_rule("user-rule", RuleScope.USER))
-            store.save_rule(create_test_rule("project-rule", RuleScope.PROJECT))
-            
-            # Reload and verify
-            store.reload()
-            
-            assert len(store.list_rules()) == 3
-            assert len(store.list_rules(RuleScope.GLOBAL)) == 1
-            assert len(store.list_rules(RuleScope.USER)) == 1
-            assert len(store.list_rules(RuleScope.PROJECT)) == 1
+        global_dir = tmp_path / "global"
+        user_dir = tmp_path / "user"
+        project_dir = tmp_path / "project"
+        
+        store = FileRuleStore(
+            global_dir=global_dir,
+            user_dir=user_dir,
+            project_dir=project_dir,
+        )
+        
+        # Save rules to different scopes
+        store.save_rule(create_test_rule("global-rule", RuleScope.GLOBAL))
+        store.save_rule(create_test_rule("user-rule", RuleScope.USER))
+        store.save_rule(create_test_rule("project-rule", RuleScope.PROJECT))
+        
+        # Reload and verify
+        store.reload()
+        
+        assert len(store.list_rules()) == 3
+        assert len(store.list_rules(RuleScope.GLOBAL)) == 1
+        assert len(store.list_rules(RuleScope.USER)) == 1
+        assert len(store.list_rules(RuleScope.PROJECT)) == 1
 
-    def test_delete_rule_file(self) -> None:
+    def test_delete_rule_file(self, tmp_path: Path) -> None:
         """Test that deleting a rule removes the file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            user_dir = Path(tmpdir) / "user"
-            store = FileRuleStore(user_dir=user_dir)
-            
-            rule = create_test_rule()
-            store.save_rule(rule)
-            
-            file_path = user_dir / "test-rule.md"
-            assert file_path.exists()
-            
-            result = store.delete_rule("test-rule", RuleScope.USER)
-            assert result is True
-            assert not file_path.exists()
+        user_dir = tmp_path / "user"
+        store = FileRuleStore(user_dir=user_dir)
+        
+        rule = create_test_rule()
+        store.save_rule(rule)
+        
+        file_path = user_dir / "test-rule.md"
+        assert file_path.exists()
+        
+        result = store.delete_rule("test-rule", RuleScope.USER)
+        assert result is True
+        assert not file_path.exists()
 
-    def test_reload_picks_up_external_changes(self) -> None:
+    def test_reload_picks_up_external_changes(self, tmp_path: Path) -> None:
         """Test that reload picks up files added externally."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            user_dir = Path(tmpdir) / "user"
-            user_dir.mkdir(parents=True)
-            
-            store = FileRuleStore(user_dir=user_dir)
-            store.reload()
-            
-            assert len(store.list_rules()) == 0
-            
-            # Add a file externally
-            rule_file = user_dir / "external.md"
-            rule_file.write_text("""---
+        user_dir = tmp_path / "user"
+        user_dir.mkdir(parents=True)
+        
+        store = FileRuleStore(user_dir=user_dir)
+        store.reload()
+        
+        assert len(store.list_rules()) == 0
+        
+        # Add a file externally
+        rule_file = user_dir / "external.md"
+        rule_file.write_text("""---
 name: external
 description: Externally added rule
 ---
 
 Content.
 """)
+        
+        # Reload should pick it up
+        store.reload()
+        assert len(store.list_rules()) == 1
+        assert store.get_rule("external", RuleScope.USER) is not None
+
+    def test_reload_reparses_only_changed_files(self, tmp_path: Path) -> None:
+        """Test that reload reuses parsed rules for unchanged files."""
+        user_dir = tmp_path / "user"
+        store = FileRuleStore(user_dir=user_dir)
+        store.save_rule(create_test_rule())
+        store.reload()
+        
+        with patch.object(
+            store.parser, "parse_file", wraps=store.parser.parse_file
+        ) as parse_file:
+            store.reload()
+            assert parse_file.call_count == 0
             
-            # Reload should pick it up
+            # Editing the file in place must be picked up
+            (user_dir / "test-rule.md").write_text("""---
+name: test-rule
+description: Edited description
+---
+
+Edited content.
+""")
             store.reload()
-            assert len(store.list_rules()) == 1
-            assert store.get_rule("external", RuleScope.USER) is not None
+            assert parse_file.call_count == 1
+        
+        rule = store.get_rule("test-rule", RuleScope.USER)
+        assert rule is not None
+        assert rule.description == "Edited description"
 
-    def test_caching_behavior(self) -> None:
+    def test_reload_discards_unsaved_edits(self, tmp_path: Path) -> None:
+        """Test that reload restores on-disk values for unchanged files."""
+        user_dir = tmp_path / "user"
+        store = FileRuleStore(user_dir=user_dir)
+        store.save_rule(create_test_rule())
+        store.reload()
+        
+        rule = store.get_rule("test-rule", RuleScope.USER)
+        assert rule is not None
+        rule.description = "mutated-not-saved"
+        rule.metadata["extra"] = "mutated"
+        
+        store.reload()
+        reloaded = store.get_rule("test-rule", RuleScope.USER)
+        
+        assert reloaded is not None
+        assert reloaded is not rule
+        assert reloaded.description == "Test rule description"
+        assert "extra" not in reloaded.metadata
+
+    def test_caching_behavior(self, tmp_path: Path) -> None:
         """Test that rules are cached after first load."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            user_dir = Path(tmpdir) / "user"
-            store = FileRuleStore(user_dir=user_dir)
-            
-            rule = create_test_rule()
-            store.save_rule(rule)
-            
-            # First access triggers load
-            rules1 = store.list_rules()
-            assert len(rules1) == 1
-            
-            # Second access uses cache (no reload)
-            rules2 = store.list_rules()
-            assert len(rules2) == 1
+        user_dir = tmp_path / "user"
+        store = FileRuleStore(user_dir=user_dir)
+        
+        rule = create_test_rule()
+        store.save_rule(rule)
+        
+        # First access triggers load
+        rules1 = store.list_rules()
+        assert len(rules1) == 1
+        
+        # Second access uses cache (no reload)
+        rules2 = store.list_rules()
+        assert len(rules2) == 1
 
-    def test_save_rule_with_all_options(self) -> None:
+    def test_save_rule_with_all_options(self, tmp_path: Path) -> None:
         """Test saving a rule with all optional fields."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            user_dir = Path(tmpdir) / "user"
-            store = FileRuleStore(user_dir=user_dir)
-            
-            rule = Rule(
-                name="full-rule",
-                description="Rule with all options",
-                content="# Full Rule\n\nContent here.",
-                scope=RuleScope.USER,
-                inclusion=RuleInclusion.FILE_MATCH,
-                file_match_pattern="*.py",
-                priority=80,
-                override=True,
-                enabled=False,
-            )
-            store.save_rule(rule)
-            
-            # Reload and verify all fields
-            store.reload()
-            retrieved = store.get_rule("full-rule", RuleScope.USER)
-            
-            assert retrieved is not None
-            assert retrieved.inclusion == RuleInclusion.FILE_MATCH
-            assert retrieved.file_match_pattern == "*.py"
-            assert retrieved.priority == 80
-            assert retrieved.override is True
-            assert retrieved.enabled is False
-
-    def test_get_rule_path(self) -> None:
+        user_dir = tmp_path / "user"
+        store = FileRuleStore(user_dir=user_dir)
+        
+        rule = Rule(
+            name="full-rule",
+            description="Rule with all options",
+            content="# Full Rule\n\nContent here.",
+            scope=RuleScope.USER,
+            inclusion=RuleInclusion.FILE_MATCH,
+            file_match_pattern="*.py",
+            priority=80,
+            override=True,
+            enabled=False,
+        )
+        store.save_rule(rule)
+        
+        # Reload and verify all fields
+        store.reload()
+        retrieved = store.get_rule("full-rule", RuleScope.USER)
+        
+        assert retrieved is not None
+        assert retrieved.inclusion == RuleInclusion.FILE_MATCH
+        assert retrieved.file_match_pattern == "*.py"
+        assert retrieved.priority == 80
+        assert retrieved.override is True
+        assert retrieved.enabled is False
+
+    def test_get_rule_path(self, tmp_path: Path) -> None:
         """Test getting the file path for a rule."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            user_dir = Path(tmpdir) / "user"
-            store = FileRuleStore(user_dir=user_dir)
-            
-            path = store.get_rule_path("test", RuleScope.USER)
-            assert path == user_dir / "test.md"
+        user_dir = tmp_path / "user"
+        store = FileRuleStore(user_dir=user_dir)
+        
+        path = store.get_rule_path("test", RuleScope.USER)
+        assert path == user_dir / "test.md"
 
     def test_save_without_configured_dir(self) -> None:
         """Test that saving to unconfigured scope raises error."""
@@ -280,35 +320,54 @@ Content.
         with pytest.raises(ValueError, match="No directory configured"):
             store.save_rule(rule)
 
-    def test_invalid_rule_file_skipped(self) -> None:
+    def test_invalid_rule_file_skipped(self, tmp_path: Path) -> None:
         """Test that invalid rule files are skipped during load."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            user_dir = Path(tmpdir) / "user"
-            user_dir.mkdir(parents=True)
-            
-            # Create a valid rule
-            valid_file = user_dir / "valid.md"
-            valid_file.write_text("""---
+        user_dir = tmp_path / "user"
+        user_dir.mkdir(parents=True)
+        
+        # Create a valid rule
+        valid_file = user_dir / "valid.md"
+        valid_file.write_text("""---
 name: valid
 description: Valid rule
 ---
 
 Content.
 """)
-            
-            # Create an invalid rule (missing description)
-            invalid_file = user_dir / "invalid.md"
-            invalid_file.write_text("""---
+        
+        # Create an invalid rule (missing description)
+        invalid_file = user_dir / "invalid.md"
+        invalid_file.write_text("""---
 name: invalid
 ---
 
 Content.
 """)
-            
-            store = FileRuleStore(user_dir=user_dir)
-            store.reload()
-            
-            # Only valid rule should be loaded
-            rules = store.list_rules()
-            assert len(rules) == 1
-            assert rules[0].name == "valid"
+        
+        store = FileRuleStore(user_dir=user_dir)
+        store.reload()
+        
+        # Only valid rule should be loaded
+        rules = store.list_rules()
+        assert len(rules) == 1
+        assert rules[0].name == "valid"
+
+    def test_non_markdown_entries_skipped(self, tmp_path: Path) -> None:
+        """Test that only regular .md files are loaded from a scope dir."""
+        user_dir = tmp_path / "user"
+        user_dir.mkdir(parents=True)
+        
+        (user_dir / "valid.md").write_text("""---
+name: valid
+description: Valid rule
+---
+
+Content.
+""")
+        (user_dir / "notes.txt").write_text("Not a rule.")
+        (user_dir / "folder.md").mkdir()
+        
+        store = FileRuleStore(user_dir=user_dir)
+        store.reload()
+        
+        assert [r.name for r in store.list_rules()] == ["valid"]